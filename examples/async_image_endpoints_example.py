@@ -1,4 +1,5 @@
 import asyncio
+import sys
 
 from viscribe import AsyncClient
 from viscribe.logger import viscribe_logger
@@ -10,57 +11,93 @@ viscribe_logger.set_logging(level="INFO")
 async def main():
 
     client = AsyncClient(api_key="vscrb-")
-    
+
+    image_url = "https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE="
+
+    # The requests are independent, so build the coroutines first and let
+    # asyncio.gather run them concurrently over the client's shared session.
+
     # 1. Describe Image
-    describe_resp = await client.describe_image(
-        image_url="https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE="
-    )
-    print("Describe Image:", describe_resp)
+    describe = client.describe_image(image_url=image_url)
 
     # 2. Extract Structured Data - Using simple fields
-    extract_resp = await client.extract_image(
-        image_url="https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE=",
+    extract_fields = client.extract_image(
+        image_url=image_url,
         fields=[
             {"name": "city_name", "type": "text", "description": "Name of the city in the image"},
             {"name": "water_bodies", "type": "array_text", "description": "List of water bodies visible"},
         ],
     )
-    print("Extract Image:", extract_resp)
-    
+
     # Alternative: Using advanced_schema for complex structures
- 
+
     class Product(BaseModel):
         product_name: str
         price: float
 
-    extract_resp = await client.extract_image(
-        image_url="https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE=",
+    extract_advanced = client.extract_image(
+        image_url=image_url,
         advanced_schema=Product,
     )
-    print("Extract Image (Advanced):", extract_resp)
 
     # 3. Classify Image
-    classify_resp = await client.classify_image(
-        image_url="https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE=",
+    classify = client.classify_image(
+        image_url=image_url,
         classes=["cat", "dog"]
     )
-    print("Classify Image:", classify_resp)
 
     # 4. Ask a Question
-    ask_resp = await client.ask_image(
-        image_url="https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE=",
+    ask = client.ask_image(
+        image_url=image_url,
         question="What color is the car?",
     )
-    print("Ask Image:", ask_resp)
 
     # 5. Compare Images
-    compare_resp = await client.compare_images(
-        image1_url="https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE=",
-        image2_url="https://media.istockphoto.com/id/1388018793/photo/grand-canal-in-venice.jpg?s=612x612&w=0&k=20&c=uDUrctquPNUPzlpNLwTkJIkc1Gig0aUWJknF6FrqxJE=",
+    compare = client.compare_images(
+        image1_url=image_url,
+        image2_url=image_url,
+    )
+
+    (
+        describe_resp,
+        extract_resp,
+        extract_advanced_resp,
+        classify_resp,
+        ask_resp,
+        compare_resp,
+    ) = await asyncio.gather(
+        describe, extract_fields, extract_advanced, classify, ask, compare
     )
+
+    print("Describe Image:", describe_resp)
+    print("Extract Image:", extract_resp)
+    print("Extract Image (Advanced):", extract_advanced_resp)
+    print("Classify Image:", classify_resp)
+    print("Ask Image:", ask_resp)
     print("Compare Images:", compare_resp)
 
+    # 6. Describe a batch of images, at most 8 requests in flight at once
+    batch_resp = await client.describe_images(
+        [image_url, image_url, image_url], concurrency=8, generate_tags=False
+    )
+    print("Describe Images (Batch):", batch_resp)
+
+    # 7. Compare several image pairs in one request
+    bulk_compare_resp = await client.compare_images_bulk(
+        [(image_url, image_url), (image_url, image_url)]
+    )
+    print("Compare Images (Batch):", bulk_compare_resp)
+
     await client.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional and not available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None and sys.platform != "win32":
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
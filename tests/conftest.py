@@ -0,0 +1,78 @@
+import asyncio
+import sys
+
+import pytest
+import pytest_asyncio
+import responses
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+
+from tests.utils import generate_mock_api_key
+from viscribe.async_client import AsyncClient
+from viscribe.client import Client
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is available."""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def mock_api_key():
+    return generate_mock_api_key()
+
+
+@pytest.fixture(scope="session")
+def client(mock_api_key):
+    """One Client (and connection pool) shared by the whole test session."""
+    with Client(api_key=mock_api_key) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aiohttp_session():
+    """One aiohttp session (and connection pool) for the session event loop."""
+    async with ClientSession() as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(mock_api_key, aiohttp_session):
+    """One AsyncClient shared by every test running on the session event loop."""
+    client = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key)
+    async with client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def _requests_mock():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mocked_responses(_requests_mock):
+    """Module-wide ``responses`` mock, reset after every test."""
+    yield _requests_mock
+    _requests_mock.reset()
+
+
+@pytest.fixture(scope="module")
+def _aiohttp_mock():
+    with aioresponses() as mock:
+        yield mock
+
+
+@pytest.fixture
+def mocked_aiohttp(_aiohttp_mock):
+    """Module-wide ``aioresponses`` mock, cleared after every test."""
+    yield _aiohttp_mock
+    _aiohttp_mock.clear()
@@ -1,11 +1,17 @@
+import asyncio
 import base64
-from uuid import uuid4
+import gc
+import gzip
+import json
 
 import pytest
-from aioresponses import aioresponses
+from aiohttp import ClientConnectionError, ClientResponseError, ServerDisconnectedError
+from yarl import URL
 
-from tests.utils import generate_mock_api_key
+from tests.utils import generate_mock_api_key, generate_mock_uuid
+from viscribe import async_client
 from viscribe.async_client import AsyncClient
+from viscribe.config import API_BASE_URL
 from viscribe.exceptions import APIError
 from viscribe.models.image import (
     ImageAskRequest,
@@ -19,155 +25,588 @@ from viscribe.models.image import (
     ImageExtractRequest,
     ImageExtractResponse,
 )
+from viscribe.utils.cache import ResponseCache
 
+# Share the session-scoped AsyncClient fixture's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-def mock_api_key():
-    return generate_mock_api_key()
+API_URL = URL(API_BASE_URL)
 
 
 @pytest.fixture
 def mock_uuid():
-    return str(uuid4())
+    return generate_mock_uuid()
 
 
-@pytest.mark.asyncio
-async def test_get_credits(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.get(
-            "https://api.ViscribeAI.com/v1/credits",
-            payload={"remaining_credits": 100, "total_credits_used": 50},
-        )
+async def test_get_credits(async_client, mocked_aiohttp):
+    mocked_aiohttp.get(
+        API_URL / "credits",
+        payload={"remaining_credits": 100, "total_credits_used": 50},
+    )
 
-        async with AsyncClient(api_key=mock_api_key) as client:
-            response = await client.get_credits()
-            assert response["remaining_credits"] == 100
-            assert response["total_credits_used"] == 50
+    response = await async_client.get_credits()
+    assert response.remaining_credits == 100
+    assert response.total_credits_used == 50
 
 
-@pytest.mark.asyncio
-async def test_submit_feedback(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://api.ViscribeAI.com/v1/feedback", payload={"status": "success"}
-        )
+async def test_submit_feedback(async_client, mocked_aiohttp):
+    request_id, feedback_id = generate_mock_uuid(), generate_mock_uuid()
+    mocked_aiohttp.post(
+        API_URL / "feedback",
+        payload={
+            "feedback_id": feedback_id,
+            "request_id": request_id,
+            "message": "Feedback submitted",
+            "feedback_timestamp": "2025-01-01T12:00:00Z",
+        },
+    )
 
-        async with AsyncClient(api_key=mock_api_key) as client:
-            response = await client.submit_feedback(
-                request_id=str(uuid4()), rating=5, feedback_text="Great service!"
-            )
-            assert response["status"] == "success"
-
-
-@pytest.mark.asyncio
-async def test_api_error(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://api.viscribe.ai/v1/images/describe",
-            status=400,
-            payload={"error": "Bad request"},
-            exception=APIError("Bad request", status_code=400),
-        )
+    response = await async_client.submit_feedback(
+        request_id=request_id, rating=5, feedback_text="Great service!"
+    )
+    assert str(response.feedback_id) == feedback_id
+    assert str(response.request_id) == request_id
+    assert response.message == "Feedback submitted"
 
-        async with AsyncClient(api_key=mock_api_key) as client:
-            with pytest.raises(APIError) as exc_info:
-                await client.describe_image(image_url="https://example.com")
-            assert exc_info.value.status_code == 400
-            assert "Bad request" in str(exc_info.value)
-
-
-@pytest.mark.asyncio
-async def test_describe_image(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://api.ViscribeAI.com/v1/images/describe",
-            payload={
-                "request_id": "req-1",
-                "credits_used": 1,
-                "image_description": "A cat on a mat.",
-                "tags": ["cat", "mat"],
-            },
-        )
-        req = ImageDescribeRequest(image_url="https://img.com/cat.jpg")
-        async with AsyncClient(api_key=mock_api_key) as client:
-            resp = await client.describe_image(req)
-            assert resp.request_id == "req-1"
-            assert resp.image_description == "A cat on a mat."
-            assert resp.tags == ["cat", "mat"]
-
-
-@pytest.mark.asyncio
-async def test_extract_image(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://api.ViscribeAI.com/v1/images/extract",
-            payload={
-                "request_id": "req-2",
-                "credits_used": 2,
-                "extracted_data": {"product_name": "Widget", "price": 9.99},
-            },
-        )
-        req = ImageExtractRequest(
-            image_url="https://img.com/prod.jpg", output_schema={"type": "object"}
-        )
-        async with AsyncClient(api_key=mock_api_key) as client:
-            resp = await client.extract_image(req)
-            assert resp.request_id == "req-2"
-            assert resp.extracted_data["product_name"] == "Widget"
-            assert resp.extracted_data["price"] == 9.99
-
-
-@pytest.mark.asyncio
-async def test_classify_image(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://api.ViscribeAI.com/v1/images/classify",
-            payload={
-                "request_id": "req-3",
-                "credits_used": 1,
-                "classification": ["cat"],
-            },
-        )
-        req = ImageClassifyRequest(
-            image_url="https://img.com/cat.jpg", classes=["cat", "dog"]
+
+async def test_api_error(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "describe",
+        status=400,
+        payload={"error": "Bad request"},
+        exception=APIError("Bad request", status_code=400),
+    )
+
+    with pytest.raises(APIError) as exc_info:
+        await async_client.describe_image(image_url="https://example.com")
+    assert exc_info.value.status_code == 400
+    assert "Bad request" in str(exc_info.value)
+
+
+async def test_describe_image(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "describe",
+        payload={
+            "request_id": "req-1",
+            "credits_used": 1,
+            "image_description": "A cat on a mat.",
+            "tags": ["cat", "mat"],
+        },
+    )
+    req = ImageDescribeRequest(image_url="https://img.com/cat.jpg")
+    resp = await async_client.describe_image(req)
+    assert resp.request_id == "req-1"
+    assert resp.image_description == "A cat on a mat."
+    assert resp.tags == ["cat", "mat"]
+
+
+async def test_extract_image(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "extract",
+        payload={
+            "request_id": "req-2",
+            "credits_used": 2,
+            "extracted_data": {"product_name": "Widget", "price": 9.99},
+        },
+    )
+    req = ImageExtractRequest(
+        image_url="https://img.com/prod.jpg",
+        fields=[
+            {"name": "product_name", "type": "text"},
+            {"name": "price", "type": "number"},
+        ],
+    )
+    resp = await async_client.extract_image(req)
+    assert resp.request_id == "req-2"
+    assert resp.extracted_data["product_name"] == "Widget"
+    assert resp.extracted_data["price"] == 9.99
+
+
+async def test_classify_image(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "classify",
+        payload={
+            "request_id": "req-3",
+            "credits_used": 1,
+            "classification": ["cat"],
+        },
+    )
+    req = ImageClassifyRequest(
+        image_url="https://img.com/cat.jpg", classes=["cat", "dog"]
+    )
+    resp = await async_client.classify_image(req)
+    assert resp.request_id == "req-3"
+    assert resp.classification == ["cat"]
+
+
+async def test_ask_image(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "ask",
+        payload={"request_id": "req-4", "credits_used": 1, "answer": "Blue"},
+    )
+    req = ImageAskRequest(
+        image_url="https://img.com/car.jpg", question="What color is the car?"
+    )
+    resp = await async_client.ask_image(req)
+    assert resp.request_id == "req-4"
+    assert resp.answer == "Blue"
+
+
+async def test_compare_images(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "compare",
+        payload={
+            "request_id": "req-5",
+            "credits_used": 2,
+            "comparison_result": "Both images show cats, but one is black and one is white.",
+        },
+    )
+    req = ImageCompareRequest(
+        image1_url="https://img.com/cat1.jpg", image2_url="https://img.com/cat2.jpg"
+    )
+    resp = await async_client.compare_images(req)
+    assert resp.request_id == "req-5"
+    assert "cats" in resp.comparison_result
+
+
+async def test_describe_images(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "describe",
+        payload={
+            "request_id": "req-1",
+            "credits_used": 1,
+            "image_description": "A cat on a mat.",
+            "tags": ["cat", "mat"],
+        },
+        repeat=True,
+    )
+    urls = [f"https://img.com/cat{i}.jpg" for i in range(5)]
+    resps = await async_client.describe_images(urls, concurrency=2)
+    assert len(resps) == 5
+    assert all(r.image_description == "A cat on a mat." for r in resps)
+
+
+async def test_identical_requests_are_coalesced(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, coalesce_requests=True
+    )
+    # Registered once: a second HTTP call would fail to match
+    mocked_aiohttp.post(
+        API_URL / "images" / "describe",
+        payload={
+            "request_id": "req-1",
+            "credits_used": 1,
+            "image_description": "A cat on a mat.",
+        },
+    )
+    first, second = await asyncio.gather(
+        client.describe_image(image_url="https://img.com/cat.jpg"),
+        client.describe_image(image_url="https://img.com/cat.jpg"),
+    )
+    assert first.request_id == second.request_id == "req-1"
+    assert client._inflight == {}
+
+
+async def test_uncached_requests_skip_the_cache_key(
+    async_client, mocked_aiohttp, monkeypatch
+):
+    def fail(*args):
+        raise AssertionError("cache key computed without cache or coalescing")
+
+    monkeypatch.setattr("viscribe.async_client.make_cache_key", fail)
+    mocked_aiohttp.post(
+        API_URL / "images" / "describe",
+        payload={
+            "request_id": "req-1",
+            "credits_used": 1,
+            "image_description": "A cat.",
+        },
+    )
+    resp = await async_client.describe_image(image_url="https://img.com/cat.jpg")
+    assert resp.request_id == "req-1"
+
+
+async def test_orphaned_coalesced_request_error_is_retrieved(
+    mock_api_key, aiohttp_session, monkeypatch
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, coalesce_requests=True
+    )
+    release = asyncio.Event()
+
+    async def failing_request(*args, **kwargs):
+        await release.wait()
+        raise APIError("Unavailable", status_code=503)
+
+    monkeypatch.setattr(client, "_make_request", failing_request)
+    caller = asyncio.ensure_future(
+        client.describe_image(image_url="https://img.com/cat.jpg")
+    )
+    await asyncio.sleep(0)
+    (inflight,) = client._inflight.values()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    release.set()
+    await asyncio.wait([inflight])
+
+    loop = asyncio.get_running_loop()
+    unretrieved = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: unretrieved.append(context))
+    try:
+        del inflight
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+    assert unretrieved == []
+
+
+async def test_compare_images_bulk(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "compare:batch",
+        payload={
+            "results": [
+                {"request_id": "req-5", "credits_used": 2, "comparison_result": "Same"},
+                {
+                    "request_id": "req-6",
+                    "credits_used": 2,
+                    "comparison_result": "Different",
+                },
+            ]
+        },
+    )
+    resps = await async_client.compare_images_bulk(
+        [
+            ("https://img.com/cat1.jpg", "https://img.com/cat1.jpg"),
+            ("https://img.com/cat1.jpg", "https://img.com/dog.jpg"),
+        ]
+    )
+    assert [r.request_id for r in resps] == ["req-5", "req-6"]
+
+
+async def test_compare_images_bulk_falls_back(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key)
+    mocked_aiohttp.post(
+        API_URL / "images" / "compare:batch",
+        status=404,
+        payload={"error": "Not found"},
+    )
+    mocked_aiohttp.post(
+        API_URL / "images" / "compare",
+        payload={"request_id": "req-5", "credits_used": 2, "comparison_result": "Same"},
+        repeat=True,
+    )
+    resps = await client.compare_images_bulk(
+        [
+            ("https://img.com/cat1.jpg", "https://img.com/cat2.jpg"),
+            ("https://img.com/cat3.jpg", "https://img.com/cat4.jpg"),
+        ]
+    )
+    assert len(resps) == 2
+    assert not client._bulk_compare_supported
+
+
+async def test_batch_rejects_bad_concurrency(async_client):
+    # A zero-sized semaphore would otherwise block every request forever
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(
+            async_client.describe_images(["https://img.com/cat.jpg"], concurrency=0),
+            timeout=1,
         )
-        async with AsyncClient(api_key=mock_api_key) as client:
-            resp = await client.classify_image(req)
-            assert resp.request_id == "req-3"
-            assert resp.classification == ["cat"]
-
-
-@pytest.mark.asyncio
-async def test_ask_image(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://api.ViscribeAI.com/v1/images/ask",
-            payload={"request_id": "req-4", "credits_used": 1, "answer": "Blue"},
+
+
+async def test_compare_images_bulk_rejects_bad_concurrency(
+    async_client, mocked_aiohttp
+):
+    batch_url = API_URL / "images" / "compare:batch"
+    sent = len(mocked_aiohttp.requests.get(("POST", batch_url), []))
+    with pytest.raises(ValueError):
+        await async_client.compare_images_bulk(
+            [("https://img.com/cat1.jpg", "https://img.com/cat2.jpg")], concurrency=0
         )
-        req = ImageAskRequest(
-            image_url="https://img.com/car.jpg", question="What color is the car?"
+    # Rejected before the batch request is sent
+    assert len(mocked_aiohttp.requests.get(("POST", batch_url), [])) == sent
+
+
+async def test_compare_images_bulk_malformed_response(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key)
+    client._credits = (0.0, None)
+    mocked_aiohttp.post(API_URL / "images" / "compare:batch", payload={"status": "ok"})
+    with pytest.raises(APIError, match="Unexpected batch compare response"):
+        await client.compare_images_bulk(
+            [("https://img.com/cat1.jpg", "https://img.com/cat2.jpg")]
         )
-        async with AsyncClient(api_key=mock_api_key) as client:
-            resp = await client.ask_image(req)
-            assert resp.request_id == "req-4"
-            assert resp.answer == "Blue"
-
-
-@pytest.mark.asyncio
-async def test_compare_images(mock_api_key):
-    with aioresponses() as mocked:
-        mocked.post(
-            "https://api.ViscribeAI.com/v1/images/compare",
-            payload={
-                "request_id": "req-5",
-                "credits_used": 2,
-                "comparison_result": "Both images show cats, but one is black and one is white.",
-            },
+    # The batch was still sent, so cached credits are stale
+    assert client._credits is None
+
+
+async def test_shared_session_is_left_open(mock_api_key, aiohttp_session):
+    client = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key)
+    assert client.session is aiohttp_session
+    await client.close()
+    assert not aiohttp_session.closed
+
+
+async def test_connector_limits_are_configurable(mock_api_key):
+    client = AsyncClient(
+        api_key=mock_api_key, connector_limit=0, connector_limit_per_host=256
+    )
+    async with client:
+        assert client.session.connector.limit == 0
+        assert client.session.connector.limit_per_host == 256
+
+
+async def test_rate_limited_request_is_retried(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, retry_delay=0
+    )
+    mocked_aiohttp.get(
+        API_URL / "credits",
+        status=429,
+        payload={"error": "Too many requests"},
+        headers={"Retry-After": "0"},
+    )
+    mocked_aiohttp.get(
+        API_URL / "credits",
+        payload={"remaining_credits": 100, "total_credits_used": 50},
+    )
+    response = await client.get_credits()
+    assert response.remaining_credits == 100
+
+
+async def test_transient_errors_are_retried(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, retry_delay=0
+    )
+    mocked_aiohttp.get(API_URL / "credits", exception=ServerDisconnectedError())
+    mocked_aiohttp.get(
+        API_URL / "credits", status=503, payload={"error": "Unavailable"}
+    )
+    mocked_aiohttp.get(
+        API_URL / "credits",
+        payload={"remaining_credits": 100, "total_credits_used": 50},
+    )
+    response = await client.get_credits()
+    assert response.remaining_credits == 100
+
+
+async def test_client_errors_are_not_retried(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, retry_delay=0
+    )
+    # Registered once: a retry would fail to match and raise ConnectionError
+    mocked_aiohttp.get(
+        API_URL / "credits", status=401, payload={"error": "Invalid API key"}
+    )
+    with pytest.raises(APIError) as exc_info:
+        await client.get_credits()
+    assert exc_info.value.status_code == 401
+
+
+async def test_non_json_error_body_raises_api_error(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, max_retries=1
+    )
+    mocked_aiohttp.get(
+        API_URL / "credits",
+        status=502,
+        body="<html><body>502 Bad Gateway</body></html>",
+        content_type="text/html",
+    )
+    with pytest.raises(APIError) as exc_info:
+        await client.get_credits()
+    assert exc_info.value.status_code == 502
+    assert "502 Bad Gateway" in exc_info.value.message
+
+
+async def test_concurrent_get_credits_share_one_request(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key)
+    # Registered once: a second HTTP call would fail to match
+    mocked_aiohttp.get(
+        API_URL / "credits",
+        payload={"remaining_credits": 100, "total_credits_used": 50},
+    )
+    first, second = await asyncio.gather(client.get_credits(), client.get_credits())
+    cached = await client.get_credits()
+    assert first is second is cached
+    assert client._credits_inflight is None
+
+
+async def test_describe_images_with_per_image_arguments(async_client, mocked_aiohttp):
+    mocked_aiohttp.post(
+        API_URL / "images" / "describe",
+        payload={
+            "request_id": "req-1",
+            "credits_used": 1,
+            "image_description": "A cat on a mat.",
+        },
+    )
+    mocked_aiohttp.post(
+        API_URL / "images" / "describe", status=400, payload={"error": "Bad image"}
+    )
+    resps = await async_client.describe_images(
+        [
+            {"image_url": "https://img.com/cat.jpg", "instruction": "Be brief"},
+            "https://img.com/broken.jpg",
+        ],
+        concurrency=1,
+        return_exceptions=True,
+        generate_tags=False,
+    )
+    assert resps[0].request_id == "req-1"
+    assert isinstance(resps[1], APIError)
+
+
+async def test_session_is_created_lazily(mock_api_key):
+    client = AsyncClient(api_key=mock_api_key)
+    assert client.session is None
+    async with client:
+        assert client.session is not None
+    assert client.session is None
+
+
+async def test_httpx_transport(mock_api_key):
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        assert request.headers["VISCRIBE-APIKEY"] == mock_api_key
+        return httpx.Response(
+            200, json={"remaining_credits": 100, "total_credits_used": 50}
         )
-        req = ImageCompareRequest(
-            image1_url="https://img.com/cat1.jpg", image2_url="https://img.com/cat2.jpg"
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+        client = AsyncClient.from_session(session, api_key=mock_api_key)
+        assert client.transport == "httpx"
+        response = await client.get_credits()
+    assert response.remaining_credits == 100
+
+
+async def test_httpx_transport_leaves_shared_ssl_context_alone(
+    mock_api_key, monkeypatch
+):
+    pytest.importorskip("httpx")
+    alpn_calls = []
+    monkeypatch.setattr(async_client._SSL_CTX, "set_alpn_protocols", alpn_calls.append)
+
+    # A plain TCP server: the TLS handshake fails right after ALPN is set
+    async def reject(reader, writer):
+        writer.close()
+
+    server = await asyncio.start_server(reject, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server, AsyncClient(api_key=mock_api_key, transport="httpx") as client:
+        with pytest.raises(ClientConnectionError):
+            await client._send("GET", URL(f"https://127.0.0.1:{port}/"))
+    assert alpn_calls == []
+
+
+async def test_client_response_error_becomes_api_error(
+    mock_api_key, aiohttp_session, mocked_aiohttp
+):
+    client = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key)
+    mocked_aiohttp.get(
+        API_URL / "credits",
+        exception=ClientResponseError(
+            None, (), status=413, message="Payload Too Large"
+        ),
+    )
+    with pytest.raises(APIError) as exc_info:
+        await client.get_credits()
+    assert exc_info.value.status_code == 413
+
+
+async def test_unvalidated_responses(
+    mock_api_key, aiohttp_session, mocked_aiohttp, mock_uuid
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, validate_responses=False
+    )
+    mocked_aiohttp.post(
+        API_URL / "images" / "ask",
+        payload={"request_id": mock_uuid, "credits_used": "1", "answer": "A cat"},
+    )
+    response = await client.ask_image(
+        image_url="https://example.com/image.jpg", question="What is it?"
+    )
+    assert isinstance(response, ImageAskResponse)
+    assert response.answer == "A cat"
+    # model_construct keeps server values as sent instead of coercing them
+    assert response.credits_used == "1"
+
+
+async def test_clients_share_injected_cache(
+    mock_api_key, aiohttp_session, mocked_aiohttp, mock_uuid
+):
+    cache = ResponseCache(maxsize=8, ttl=60)
+    first = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key, cache=cache)
+    second = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, cache=cache
+    )
+    mocked_aiohttp.post(
+        API_URL / "images" / "ask",
+        payload={"request_id": mock_uuid, "credits_used": 1, "answer": "A cat"},
+    )
+    kwargs = {"image_url": "https://example.com/image.jpg", "question": "What is it?"}
+    response = await first.ask_image(**kwargs)
+    # Only one response is mocked, so this must come from the shared cache
+    assert await second.ask_image(**kwargs) == response
+    assert len(cache) == 1
+
+
+async def test_shared_cache_is_per_api_key(
+    mock_api_key, aiohttp_session, mocked_aiohttp, mock_uuid
+):
+    cache = ResponseCache(maxsize=8, ttl=60)
+    first = AsyncClient.from_session(aiohttp_session, api_key=mock_api_key, cache=cache)
+    second = AsyncClient.from_session(
+        aiohttp_session, api_key=generate_mock_api_key(), cache=cache
+    )
+    for answer in ("A cat", "A dog"):
+        mocked_aiohttp.post(
+            API_URL / "images" / "ask",
+            payload={"request_id": mock_uuid, "credits_used": 1, "answer": answer},
         )
-        async with AsyncClient(api_key=mock_api_key) as client:
-            resp = await client.compare_images(req)
-            assert resp.request_id == "req-5"
-            assert "cats" in resp.comparison_result
+    kwargs = {"image_url": "https://example.com/image.jpg", "question": "What is it?"}
+    assert (await first.ask_image(**kwargs)).answer == "A cat"
+    assert (await second.ask_image(**kwargs)).answer == "A dog"
+    assert len(cache) == 2
+
+
+async def test_large_bodies_are_gzipped(
+    mock_api_key, aiohttp_session, mocked_aiohttp, mock_uuid
+):
+    client = AsyncClient.from_session(
+        aiohttp_session, api_key=mock_api_key, compress=True
+    )
+    url = API_URL / "images" / "describe"
+    mocked_aiohttp.post(
+        url,
+        payload={
+            "request_id": mock_uuid,
+            "credits_used": 1,
+            "image_description": "Noise",
+        },
+    )
+    await client.describe_image(image_bytes=b"\x00" * 8192)
+    request = mocked_aiohttp.requests[("POST", url)][-1]
+    assert request.kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert request.kwargs["headers"]["VISCRIBE-APIKEY"] == mock_api_key
+    body = json.loads(gzip.decompress(request.kwargs["data"]))
+    assert base64.b64decode(body["image_base64"]) == b"\x00" * 8192
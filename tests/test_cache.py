@@ -0,0 +1,49 @@
+import pytest
+
+from viscribe.utils.cache import ResponseCache, make_cache_key
+
+
+def test_cache_key_depends_on_url_and_body():
+    url = "https://api.viscribe.ai/v1/images/describe"
+    key = "key-a"
+    assert make_cache_key(url, b'{"a":1}', key) == make_cache_key(url, b'{"a":1}', key)
+    assert make_cache_key(url, b'{"a":1}', key) != make_cache_key(url, b'{"a":2}', key)
+    assert make_cache_key(url, b'{"a":1}', key) != make_cache_key(
+        "https://api.viscribe.ai/v1/images/ask", b'{"a":1}', key
+    )
+
+
+def test_cache_key_depends_on_api_key():
+    url = "https://api.viscribe.ai/v1/images/describe"
+    key = make_cache_key(url, b'{"a":1}', "key-a")
+    assert key != make_cache_key(url, b'{"a":1}', "key-b")
+    assert "key-a" not in repr(key)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_cache_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        ResponseCache(maxsize=0)
+
+
+def test_cache_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("viscribe.utils.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    now[0] += 5
+    assert cache.get("a") == 1
+    now[0] += 5
+    assert cache.get("a") is None
+    assert len(cache) == 0
@@ -1,11 +1,15 @@
 import base64
-from uuid import uuid4
+import json
 
 import pytest
+import requests
 import responses
 
-from tests.utils import generate_mock_api_key
+from tests.utils import generate_mock_uuid
+from viscribe.base_client import BaseClient
 from viscribe.client import Client
+from viscribe.config import API_BASE_URL
+from viscribe.exceptions import APIError
 from viscribe.models.image import (
     ImageAskRequest,
     ImageAskResponse,
@@ -20,62 +24,59 @@ from viscribe.models.image import (
 )
 
 
-@pytest.fixture
-def mock_api_key():
-    return generate_mock_api_key()
-
-
 @pytest.fixture
 def mock_uuid():
-    return str(uuid4())
+    return generate_mock_uuid()
 
 
-@responses.activate
-def test_get_credits(mock_api_key):
-    responses.add(
+def test_get_credits(client, mocked_responses):
+    mocked_responses.add(
         responses.GET,
-        "https://api.ViscribeAI.com/v1/credits",
+        f"{API_BASE_URL}/credits",
         json={"remaining_credits": 100, "total_credits_used": 50},
     )
 
-    with Client(api_key=mock_api_key) as client:
-        response = client.get_credits()
-        assert response["remaining_credits"] == 100
-        assert response["total_credits_used"] == 50
+    response = client.get_credits()
+    assert response.remaining_credits == 100
+    assert response.total_credits_used == 50
 
 
-@responses.activate
-def test_submit_feedback(mock_api_key):
-    responses.add(
+def test_submit_feedback(client, mocked_responses):
+    request_id, feedback_id = generate_mock_uuid(), generate_mock_uuid()
+    mocked_responses.add(
         responses.POST,
-        "https://api.ViscribeAI.com/v1/feedback",
-        json={"status": "success"},
+        f"{API_BASE_URL}/feedback",
+        json={
+            "feedback_id": feedback_id,
+            "request_id": request_id,
+            "message": "Feedback submitted",
+            "feedback_timestamp": "2025-01-01T12:00:00Z",
+        },
     )
 
-    with Client(api_key=mock_api_key) as client:
-        response = client.submit_feedback(
-            request_id=str(uuid4()), rating=5, feedback_text="Great service!"
-        )
-        assert response["status"] == "success"
+    response = client.submit_feedback(
+        request_id=request_id, rating=5, feedback_text="Great service!"
+    )
+    assert str(response.feedback_id) == feedback_id
+    assert str(response.request_id) == request_id
+    assert response.message == "Feedback submitted"
 
 
-@responses.activate
-def test_network_error(mock_api_key):
-    responses.add(
+def test_network_error(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
-        "https://api.viscribe.ai/v1/images/describe",
+        f"{API_BASE_URL}/images/describe",
         body=ConnectionError("Network error"),
     )
 
-    with Client(api_key=mock_api_key) as client:
-        with pytest.raises(ConnectionError):
-            client.describe_image(image_url="https://example.com")
+    with pytest.raises(ConnectionError):
+        client.describe_image(image_url="https://example.com")
 
 
-def test_describe_image(mock_api_key):
-    responses.add(
+def test_describe_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
-        "https://api.ViscribeAI.com/v1/images/describe",
+        f"{API_BASE_URL}/images/describe",
         json={
             "request_id": "req-1",
             "credits_used": 1,
@@ -84,17 +85,16 @@ def test_describe_image(mock_api_key):
         },
     )
     req = ImageDescribeRequest(image_url="https://img.com/cat.jpg")
-    with Client(api_key=mock_api_key) as client:
-        resp = client.describe_image(req)
-        assert resp.request_id == "req-1"
-        assert resp.image_description == "A cat on a mat."
-        assert resp.tags == ["cat", "mat"]
+    resp = client.describe_image(req)
+    assert resp.request_id == "req-1"
+    assert resp.image_description == "A cat on a mat."
+    assert resp.tags == ["cat", "mat"]
 
 
-def test_extract_image(mock_api_key):
-    responses.add(
+def test_extract_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
-        "https://api.ViscribeAI.com/v1/images/extract",
+        f"{API_BASE_URL}/images/extract",
         json={
             "request_id": "req-2",
             "credits_used": 2,
@@ -102,49 +102,50 @@ def test_extract_image(mock_api_key):
         },
     )
     req = ImageExtractRequest(
-        image_url="https://img.com/prod.jpg", output_schema={"type": "object"}
+        image_url="https://img.com/prod.jpg",
+        fields=[
+            {"name": "product_name", "type": "text"},
+            {"name": "price", "type": "number"},
+        ],
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.extract_image(req)
-        assert resp.request_id == "req-2"
-        assert resp.extracted_data["product_name"] == "Widget"
-        assert resp.extracted_data["price"] == 9.99
+    resp = client.extract_image(req)
+    assert resp.request_id == "req-2"
+    assert resp.extracted_data["product_name"] == "Widget"
+    assert resp.extracted_data["price"] == 9.99
 
 
-def test_classify_image(mock_api_key):
-    responses.add(
+def test_classify_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
-        "https://api.ViscribeAI.com/v1/images/classify",
+        f"{API_BASE_URL}/images/classify",
         json={"request_id": "req-3", "credits_used": 1, "classification": ["cat"]},
     )
     req = ImageClassifyRequest(
         image_url="https://img.com/cat.jpg", classes=["cat", "dog"]
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.classify_image(req)
-        assert resp.request_id == "req-3"
-        assert resp.classification == ["cat"]
+    resp = client.classify_image(req)
+    assert resp.request_id == "req-3"
+    assert resp.classification == ["cat"]
 
 
-def test_ask_image(mock_api_key):
-    responses.add(
+def test_ask_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
-        "https://api.ViscribeAI.com/v1/images/ask",
+        f"{API_BASE_URL}/images/ask",
         json={"request_id": "req-4", "credits_used": 1, "answer": "Blue"},
     )
     req = ImageAskRequest(
         image_url="https://img.com/car.jpg", question="What color is the car?"
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.ask_image(req)
-        assert resp.request_id == "req-4"
-        assert resp.answer == "Blue"
+    resp = client.ask_image(req)
+    assert resp.request_id == "req-4"
+    assert resp.answer == "Blue"
 
 
-def test_compare_images(mock_api_key):
-    responses.add(
+def test_compare_images(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
-        "https://api.ViscribeAI.com/v1/images/compare",
+        f"{API_BASE_URL}/images/compare",
         json={
             "request_id": "req-5",
             "credits_used": 2,
@@ -154,7 +155,169 @@ def test_compare_images(mock_api_key):
     req = ImageCompareRequest(
         image1_url="https://img.com/cat1.jpg", image2_url="https://img.com/cat2.jpg"
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.compare_images(req)
-        assert resp.request_id == "req-5"
-        assert "cats" in resp.comparison_result
+    resp = client.compare_images(req)
+    assert resp.request_id == "req-5"
+    assert "cats" in resp.comparison_result
+
+
+def test_cached_describe_image(mock_api_key, mocked_responses):
+    mocked_responses.add(
+        responses.POST,
+        f"{API_BASE_URL}/images/describe",
+        json={
+            "request_id": "req-1",
+            "credits_used": 1,
+            "image_description": "A cat on a mat.",
+        },
+    )
+
+    with Client(api_key=mock_api_key, cache_size=8) as cached_client:
+        first = cached_client.describe_image(image_url="https://img.com/cat.jpg")
+        second = cached_client.describe_image(image_url="https://img.com/cat.jpg")
+        assert first == second
+        assert len(mocked_responses.calls) == 1
+
+
+def test_shared_session_is_left_open(mock_api_key, mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        f"{API_BASE_URL}/credits",
+        json={"remaining_credits": 100, "total_credits_used": 50},
+    )
+    with requests.Session() as session:
+        client = Client.from_session(session, api_key=mock_api_key)
+        client.get_credits()
+        sent = mocked_responses.calls[0].request
+        assert sent.headers["VISCRIBE-APIKEY"] == mock_api_key
+        # The owner's adapters (and their retry policy) are left alone
+        assert session.get_adapter("https://").max_retries.total == 0
+        client.close()
+
+
+def test_pool_size_is_configurable(mock_api_key):
+    with Client(api_key=mock_api_key, pool_maxsize=32) as pooled_client:
+        adapter = pooled_client.session.get_adapter("https://")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+
+
+def test_describe_images_keeps_order(client, mocked_responses):
+    urls = [f"https://img.com/{i}.jpg" for i in range(8)]
+
+    def describe_callback(request):
+        body = json.loads(request.body)
+        payload = {
+            "request_id": body["image_url"],
+            "credits_used": 1,
+            "image_description": "An image.",
+        }
+        return 200, {}, json.dumps(payload)
+
+    mocked_responses.add_callback(
+        responses.POST,
+        f"{API_BASE_URL}/images/describe",
+        callback=describe_callback,
+    )
+    results = client.describe_images(urls, concurrency=4)
+    assert [result.request_id for result in results] == urls
+
+
+def test_describe_images_can_return_exceptions(client, mocked_responses):
+    mocked_responses.add(
+        responses.POST,
+        f"{API_BASE_URL}/images/describe",
+        json={"error": "Invalid image"},
+        status=400,
+    )
+    results = client.describe_images(
+        ["https://img.com/cat.jpg"], return_exceptions=True
+    )
+    assert isinstance(results[0], APIError)
+
+
+def test_rate_limited_request_is_retried(mock_api_key, mocked_responses):
+    url = f"{API_BASE_URL}/credits"
+    mocked_responses.add(responses.GET, url, json={"error": "Slow down"}, status=429)
+    mocked_responses.add(
+        responses.GET, url, json={"remaining_credits": 100, "total_credits_used": 50}
+    )
+    with Client(api_key=mock_api_key, retry_delay=0) as retrying_client:
+        assert retrying_client.get_credits().remaining_credits == 100
+    assert len(mocked_responses.calls) == 2
+
+
+def test_exhausted_retries_raise_api_error(mock_api_key, mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        f"{API_BASE_URL}/credits",
+        json={"error": "Unavailable"},
+        status=503,
+    )
+    with Client(api_key=mock_api_key, max_retries=1, retry_delay=0) as retrying_client:
+        with pytest.raises(APIError) as exc_info:
+            retrying_client.get_credits()
+    assert exc_info.value.status_code == 503
+
+
+def test_validate_responses_defaults_from_env(mock_api_key, monkeypatch):
+    with Client(api_key=mock_api_key) as default_client:
+        assert default_client.validate_responses is True
+    monkeypatch.setenv("VISCRIBE_VALIDATE_RESPONSES", "false")
+    with Client(api_key=mock_api_key) as env_client:
+        assert env_client.validate_responses is False
+    with Client(api_key=mock_api_key, validate_responses=True) as explicit_client:
+        assert explicit_client.validate_responses is True
+
+
+def test_credits_request_is_prepared_once(mock_api_key, mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        f"{API_BASE_URL}/credits",
+        json={"remaining_credits": 100, "total_credits_used": 50},
+    )
+    with requests.Session() as session:
+        client = Client.from_session(session, api_key=mock_api_key)
+        client.get_credits()
+        prepared = client._prepared[f"{API_BASE_URL}/credits"][0]
+        assert client.get_credits(force=True).remaining_credits == 100
+        assert mocked_responses.calls[1].request is prepared
+        assert prepared.headers["VISCRIBE-APIKEY"] == mock_api_key
+
+
+def test_get_credits_is_cached_until_an_image_request(mock_api_key, mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        f"{API_BASE_URL}/credits",
+        json={"remaining_credits": 100, "total_credits_used": 50},
+    )
+    mocked_responses.add(
+        responses.POST,
+        f"{API_BASE_URL}/images/ask",
+        json={"request_id": "req-1", "credits_used": 1, "answer": "A cat"},
+    )
+    with Client(api_key=mock_api_key) as credits_client:
+        first = credits_client.get_credits()
+        assert credits_client.get_credits() is first
+        credits_client.ask_image(image_url="https://img.com/cat.jpg", question="What?")
+        assert credits_client.get_credits() is not first
+    assert len(mocked_responses.calls) == 3
+
+
+def test_non_json_error_body_raises_api_error(mock_api_key, mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        f"{API_BASE_URL}/credits",
+        body="<html><body>502 Bad Gateway</body></html>",
+        status=502,
+        content_type="text/html",
+    )
+    with Client(api_key=mock_api_key, max_retries=0) as no_retry_client:
+        with pytest.raises(APIError) as exc_info:
+            no_retry_client.get_credits()
+    assert exc_info.value.status_code == 502
+    assert "502 Bad Gateway" in exc_info.value.message
+
+
+def test_base_client_requires_a_transport(mock_api_key):
+    with pytest.raises(TypeError):
+        BaseClient(mock_api_key, True, None, 3, 1.0, 0)
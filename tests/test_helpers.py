@@ -0,0 +1,67 @@
+import pytest
+
+from tests.utils import generate_mock_api_key, generate_mock_uuid
+from viscribe.utils import helpers
+from viscribe.utils.helpers import (
+    redact_request_kwargs,
+    validate_api_key,
+    validate_base64_image,
+    validate_url_format,
+)
+
+
+def test_validate_base64_image_accepts_plain_and_data_urls():
+    assert validate_base64_image("aGVsbG8=")
+    assert validate_base64_image("data:image/png;base64,aGVsbG8=")
+
+
+@pytest.mark.parametrize(
+    "b64", ["", "aGVsbG8", "aGVs*G8=", "aGV=bG8=", b"aGVsbG8=", None]
+)
+def test_validate_base64_image_rejects_malformed_input(b64):
+    with pytest.raises(ValueError):
+        validate_base64_image(b64)
+
+
+def test_validate_base64_image_strict_decodes():
+    assert validate_base64_image("aGVsbG8=", strict=True)
+    with pytest.raises(ValueError, match="Invalid base64 image format"):
+        validate_base64_image("aGVsbG8", strict=True)
+
+
+def test_validate_api_key():
+    assert validate_api_key(generate_mock_api_key())
+    with pytest.raises(ValueError, match="must start with"):
+        validate_api_key("key-" + generate_mock_uuid())
+    with pytest.raises(ValueError, match="valid UUID"):
+        validate_api_key("vscrb-not-a-uuid")
+
+
+def test_redact_request_kwargs_hides_base64_images():
+    kwargs = {"data": b'{"image_base64":"aGVsbG8=","instruction":"Be brief"}'}
+    redacted = redact_request_kwargs(kwargs)
+    assert redacted["data"] == {"image_base64": "<8 chars>", "instruction": "Be brief"}
+    assert redact_request_kwargs({"data": b"\x1f\x8b"})["data"] == "<2 bytes>"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(helpers, "orjson", None)
+    body = helpers.json_dumps({"image_url": "https://img.com/cat.jpg", "tags": ["cat"]})
+    assert body == b'{"image_url":"https://img.com/cat.jpg","tags":["cat"]}'
+    assert helpers.json_loads(bytearray(body)) == {
+        "image_url": "https://img.com/cat.jpg",
+        "tags": ["cat"],
+    }
+
+
+def test_validate_url_format():
+    assert validate_url_format("https://img.com/cat.jpg?size=large")
+    assert validate_url_format("HTTP://img.com")
+    with pytest.raises(ValueError, match="scheme and netloc"):
+        validate_url_format("img.com/cat.jpg")
+    with pytest.raises(ValueError, match="scheme and netloc"):
+        validate_url_format("https:///cat.jpg")
+    with pytest.raises(ValueError, match="http or https"):
+        validate_url_format("ftp://img.com/cat.jpg")
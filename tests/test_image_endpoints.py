@@ -1,9 +1,13 @@
+import base64
+import json
+
 import pytest
 import responses
+from pydantic import ValidationError
 
-from tests.utils import generate_mock_api_key
 from viscribe.client import Client
 from viscribe.models.image import (
+    ExtractField,
     ImageAskRequest,
     ImageClassifyRequest,
     ImageCompareRequest,
@@ -12,14 +16,8 @@ from viscribe.models.image import (
 )
 
 
-@pytest.fixture
-def mock_api_key():
-    return generate_mock_api_key()
-
-
-@responses.activate
-def test_describe_image(mock_api_key):
-    responses.add(
+def test_describe_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
         "https://api.viscribe.ai/v1/images/describe",
         json={
@@ -30,21 +28,14 @@ def test_describe_image(mock_api_key):
         },
     )
     req = ImageDescribeRequest(image_url="https://img.com/cat.jpg")
-    with Client(api_key=mock_api_key) as client:
-        resp = client.describe_image(
-            image_url=req.image_url,
-            image_base64=req.image_base64,
-            instruction=req.instruction,
-            generate_tags=req.generate_tags,
-        )
-        assert resp.request_id == "req-1"
-        assert resp.image_description == "A cat on a mat."
-        assert resp.tags == ["cat", "mat"]
+    resp = client.describe_image(req)
+    assert resp.request_id == "req-1"
+    assert resp.image_description == "A cat on a mat."
+    assert resp.tags == ["cat", "mat"]
 
 
-@responses.activate
-def test_extract_image(mock_api_key):
-    responses.add(
+def test_extract_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
         "https://api.viscribe.ai/v1/images/extract",
         json={
@@ -54,23 +45,23 @@ def test_extract_image(mock_api_key):
         },
     )
     req = ImageExtractRequest(
-        image_url="https://img.com/prod.jpg", output_schema={"type": "object"}
+        image_url="https://img.com/prod.jpg",
+        advanced_schema={
+            "type": "object",
+            "properties": {
+                "product_name": {"type": "string"},
+                "price": {"type": "number"},
+            },
+        },
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.extract_image(
-            image_url=req.image_url,
-            image_base64=req.image_base64,
-            output_schema=req.output_schema,
-            instruction=req.instruction,
-        )
-        assert resp.request_id == "req-2"
-        assert resp.extracted_data["product_name"] == "Widget"
-        assert resp.extracted_data["price"] == 9.99
+    resp = client.extract_image(req)
+    assert resp.request_id == "req-2"
+    assert resp.extracted_data["product_name"] == "Widget"
+    assert resp.extracted_data["price"] == 9.99
 
 
-@responses.activate
-def test_classify_image(mock_api_key):
-    responses.add(
+def test_classify_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
         "https://api.viscribe.ai/v1/images/classify",
         json={"request_id": "req-3", "credits_used": 1, "classification": ["cat"]},
@@ -78,22 +69,13 @@ def test_classify_image(mock_api_key):
     req = ImageClassifyRequest(
         image_url="https://img.com/cat.jpg", classes=["cat", "dog"]
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.classify_image(
-            image_url=req.image_url,
-            image_base64=req.image_base64,
-            classes=req.classes,
-            class_descriptions=req.class_descriptions,
-            instruction=req.instruction,
-            multi_label=req.multi_label,
-        )
-        assert resp.request_id == "req-3"
-        assert resp.classification == ["cat"]
+    resp = client.classify_image(req)
+    assert resp.request_id == "req-3"
+    assert resp.classification == ["cat"]
 
 
-@responses.activate
-def test_ask_image(mock_api_key):
-    responses.add(
+def test_ask_image(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
         "https://api.viscribe.ai/v1/images/ask",
         json={"request_id": "req-4", "credits_used": 1, "answer": "Blue"},
@@ -101,19 +83,13 @@ def test_ask_image(mock_api_key):
     req = ImageAskRequest(
         image_url="https://img.com/car.jpg", question="What color is the car?"
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.ask_image(
-            image_url=req.image_url,
-            image_base64=req.image_base64,
-            question=req.question,
-        )
-        assert resp.request_id == "req-4"
-        assert resp.answer == "Blue"
+    resp = client.ask_image(req)
+    assert resp.request_id == "req-4"
+    assert resp.answer == "Blue"
 
 
-@responses.activate
-def test_compare_images(mock_api_key):
-    responses.add(
+def test_compare_images(client, mocked_responses):
+    mocked_responses.add(
         responses.POST,
         "https://api.viscribe.ai/v1/images/compare",
         json={
@@ -125,13 +101,144 @@ def test_compare_images(mock_api_key):
     req = ImageCompareRequest(
         image1_url="https://img.com/cat1.jpg", image2_url="https://img.com/cat2.jpg"
     )
-    with Client(api_key=mock_api_key) as client:
-        resp = client.compare_images(
-            image1_url=req.image1_url,
-            image1_base64=req.image1_base64,
-            image2_url=req.image2_url,
-            image2_base64=req.image2_base64,
-            instruction=req.instruction,
+    resp = client.compare_images(req)
+    assert resp.request_id == "req-5"
+    assert "cats" in resp.comparison_result
+
+
+def test_describe_image_from_path(client, mocked_responses, tmp_path):
+    image_bytes = bytes(range(256)) * 1000
+    image_path = tmp_path / "cat.jpg"
+    image_path.write_bytes(image_bytes)
+    mocked_responses.add(
+        responses.POST,
+        "https://api.viscribe.ai/v1/images/describe",
+        json={
+            "request_id": "req-6",
+            "credits_used": 1,
+            "image_description": "A cat on a mat.",
+        },
+    )
+    resp = client.describe_image(image_path=image_path)
+    assert resp.request_id == "req-6"
+    body = json.loads(mocked_responses.calls[0].request.body)
+    assert body["image_base64"] == base64.b64encode(image_bytes).decode("ascii")
+
+
+def test_describe_image_from_bytes(client, mocked_responses):
+    image_bytes = b"\xff\xd8\xff" * 100
+    mocked_responses.add(
+        responses.POST,
+        "https://api.viscribe.ai/v1/images/describe",
+        json={
+            "request_id": "req-7",
+            "credits_used": 1,
+            "image_description": "A cat on a mat.",
+        },
+    )
+    resp = client.describe_image(image_bytes=image_bytes)
+    assert resp.request_id == "req-7"
+    body = json.loads(mocked_responses.calls[0].request.body)
+    assert body["image_base64"] == base64.b64encode(image_bytes).decode("ascii")
+
+
+def test_image_path_and_base64_are_exclusive(client, tmp_path):
+    image_path = tmp_path / "cat.jpg"
+    image_path.write_bytes(b"\xff\xd8\xff")
+    with pytest.raises(ValueError):
+        client.describe_image(image_base64="aGVsbG8=", image_path=image_path)
+
+
+def test_missing_image_is_rejected_before_sending(client, mocked_responses):
+    with pytest.raises(ValueError, match="image2_url"):
+        client.compare_images(image1_url="https://img.com/cat.jpg")
+    with pytest.raises(ValueError, match="fields"):
+        client.extract_image(image_url="https://img.com/cat.jpg")
+    assert len(mocked_responses.calls) == 0
+
+
+def test_oversized_image_is_rejected_before_sending(mock_api_key, mocked_responses):
+    with Client(api_key=mock_api_key, max_payload_bytes=100) as small_client:
+        with pytest.raises(ValueError, match="max_payload_bytes"):
+            small_client.describe_image(image_bytes=b"\xff" * 101)
+    assert len(mocked_responses.calls) == 0
+
+
+def test_oversized_image_file_is_rejected_before_reading(
+    mock_api_key, mocked_responses, tmp_path, monkeypatch
+):
+    def fail(*args):
+        raise AssertionError("oversized image was read and encoded")
+
+    monkeypatch.setattr("viscribe.base_client.encode_image", fail)
+    path = tmp_path / "big.jpg"
+    path.write_bytes(b"\xff" * 101)
+    with Client(api_key=mock_api_key, max_payload_bytes=100) as small_client:
+        with pytest.raises(ValueError, match="image_path is larger"):
+            small_client.describe_image(image_path=path)
+    assert len(mocked_responses.calls) == 0
+
+
+def test_oversized_prebuilt_request_is_rejected(mock_api_key, mocked_responses):
+    req = ImageDescribeRequest(image_base64=base64.b64encode(b"\xff" * 150).decode())
+    with Client(api_key=mock_api_key, max_payload_bytes=100) as small_client:
+        with pytest.raises(ValueError, match="max_payload_bytes"):
+            small_client.describe_image(req)
+    assert len(mocked_responses.calls) == 0
+
+
+def test_extract_image_with_mixed_fields(client, mocked_responses):
+    mocked_responses.add(
+        responses.POST,
+        "https://api.viscribe.ai/v1/images/extract",
+        json={
+            "request_id": "req-8",
+            "credits_used": 2,
+            "extracted_data": {"product_name": "Widget", "price": 9.99},
+        },
+    )
+    resp = client.extract_image(
+        image_url="https://img.com/prod.jpg",
+        fields=[
+            {"name": "product_name", "type": "text"},
+            ExtractField(name="price", type="number"),
+        ],
+    )
+    assert resp.request_id == "req-8"
+    body = json.loads(mocked_responses.calls[0].request.body)
+    assert body["fields"] == [
+        {"name": "product_name", "type": "text"},
+        {"name": "price", "type": "number"},
+    ]
+
+
+def test_extract_image_rejects_invalid_field_type(client):
+    with pytest.raises(ValueError, match="type must be one of"):
+        client.extract_image(
+            image_url="https://img.com/prod.jpg",
+            fields=[{"name": "price", "type": "decimal"}],
+        )
+
+
+def test_compare_request_validates_both_images():
+    with pytest.raises(ValueError, match="Invalid image2_url"):
+        ImageCompareRequest(
+            image1_url="https://img.com/cat.jpg", image2_url="ftp://img.com/dog.jpg"
+        )
+    with pytest.raises(ValueError, match="image1_url or image1_base64, not both"):
+        ImageCompareRequest(
+            image1_url="https://img.com/cat.jpg",
+            image1_base64="aGVsbG8=",
+            image2_url="https://img.com/dog.jpg",
         )
-        assert resp.request_id == "req-5"
-        assert "cats" in resp.comparison_result
+
+
+def test_responses_are_frozen(client, mocked_responses):
+    mocked_responses.add(
+        responses.POST,
+        "https://api.viscribe.ai/v1/images/ask",
+        json={"request_id": "req-9", "credits_used": 1, "answer": "A cat"},
+    )
+    resp = client.ask_image(image_url="https://img.com/cat.jpg", question="What?")
+    with pytest.raises(ValidationError):
+        resp.answer = "A dog"
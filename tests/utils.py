@@ -1,6 +1,17 @@
+import itertools
 from uuid import uuid4
 
+# Drawn once at import so tests do not hit os.urandom for every key
+_POOL_SIZE = 256
+_UUIDS = [str(uuid4()) for _ in range(_POOL_SIZE)]
+_indices = itertools.cycle(range(_POOL_SIZE))
+
+
+def generate_mock_uuid():
+    """Return a valid UUID string from a pool generated at import time"""
+    return _UUIDS[next(_indices)]
+
 
 def generate_mock_api_key():
     """Generate a valid mock API key in the format 'vscrb-{uuid}'"""
-    return f"vscrb-{uuid4()}"
+    return f"vscrb-{generate_mock_uuid()}"
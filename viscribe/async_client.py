@@ -1,17 +1,42 @@
 import asyncio
-from typing import Any, Optional, Type, Union
+import functools
+import logging
+import os
+import ssl
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
-from aiohttp.client_exceptions import ClientError
-from pydantic import BaseModel
-
-from viscribe.config import API_BASE_URL, DEFAULT_HEADERS
+from aiohttp.client_exceptions import (
+    ClientConnectionError,
+    ClientError,
+    ClientResponseError,
+)
+from pydantic import BaseModel, TypeAdapter
+from yarl import URL
+
+from viscribe.base_client import API_PATHS, BaseClient
+from viscribe.config import (
+    API_BASE_URL,
+    DEFAULT_MAX_PAYLOAD_BYTES,
+    RETRYABLE_STATUS_CODES,
+)
 from viscribe.exceptions import APIError
 from viscribe.logger import viscribe_logger as logger
 from viscribe.models.image import (
     CreditsResponse,
-    ExtractField,
-    FeedbackRequest,
     FeedbackResponse,
     ImageAskRequest,
     ImageAskResponse,
@@ -24,38 +49,47 @@ from viscribe.models.image import (
     ImageExtractRequest,
     ImageExtractResponse,
 )
-from viscribe.utils.helpers import handle_async_response, validate_api_key
+from viscribe.utils.cache import ResponseCache, make_cache_key
+from viscribe.utils.helpers import (
+    backoff_delay,
+    json_dumps,
+    parse_response_body,
+    parse_retry_after,
+    read_async_response,
+    redact_request_kwargs,
+)
+
+try:
+    # Optional HTTP/2 transport, installed with the "http2" extra
+    import httpx
+except ImportError:
+    httpx = None
+
+T = TypeVar("T")
 
+# Parsed once so aiohttp does not re-parse the URL string on every request
+_API_URL = URL(API_BASE_URL)
+# API path -> full URL, built once at import
+_URLS: Dict[str, URL] = {path: _API_URL / path for path in API_PATHS}
 
-class AsyncClient:
+# Loading the CA bundle is expensive, so every client shares one context
+_SSL_CTX = ssl.create_default_context()
+
+
+class AsyncClient(BaseClient):
     @classmethod
-    def from_env(
-        cls,
-        verify_ssl: bool = True,
-        timeout: Optional[float] = None,
-        max_retries: int = 3,
-        retry_delay: float = 1.0,
-    ):
-        """Initialize AsyncClient using API key from environment variable.
+    def from_session(cls, session: ClientSession, api_key: str = None, **kwargs):
+        """Initialize AsyncClient on top of an existing aiohttp session.
+
+        The session's connection pool is reused and the session is left open
+        when the client is closed, so several clients can share one pool.
 
         Args:
-            verify_ssl: Whether to verify SSL certificates
-            timeout: Request timeout in seconds. None means no timeout (infinite)
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            session: aiohttp session to send requests with
+            api_key: API key for authentication. If None, will try to load from environment
+            **kwargs: Any other AsyncClient constructor argument
         """
-        from os import getenv
-
-        api_key = getenv("VISCRIBE_API_KEY")
-        if not api_key:
-            raise ValueError("VISCRIBE_API_KEY environment variable not set")
-        return cls(
-            api_key=api_key,
-            verify_ssl=verify_ssl,
-            timeout=timeout,
-            max_retries=max_retries,
-            retry_delay=retry_delay,
-        )
+        return cls(api_key=api_key, session=session, **kwargs)
 
     def __init__(
         self,
@@ -64,6 +98,21 @@ class AsyncClient:
         timeout: Optional[float] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        coalesce_requests: bool = False,
+        cache_size: int = 0,
+        session: Optional[ClientSession] = None,
+        connector_limit: int = 0,
+        connector_limit_per_host: int = 64,
+        keepalive_timeout: float = 75.0,
+        dns_cache_ttl: int = 300,
+        backoff_max: float = 30.0,
+        credits_ttl: float = 5.0,
+        transport: str = "aiohttp",
+        validate_responses: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        max_payload_bytes: Optional[int] = DEFAULT_MAX_PAYLOAD_BYTES,
+        compress: bool = False,
     ):
         """Initialize AsyncClient with configurable parameters.
 
@@ -72,99 +121,359 @@ class AsyncClient:
             verify_ssl: Whether to verify SSL certificates
             timeout: Request timeout in seconds. None means no timeout (infinite)
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds. Retries back off
+                exponentially from it with full jitter
+            coalesce_requests: Share one HTTP round-trip between identical image
+                requests that are in flight at the same time. Off by default,
+                since the callers then also share one response (and error)
+            cache_size: Number of image responses to keep in an in-memory LRU
+                cache. Identical requests are then answered without a network
+                call. 0 disables caching
+            session: Existing aiohttp session (or ``httpx.AsyncClient``) to
+                reuse. It is not closed by ``close()``; its owner is
+                responsible for that
+            connector_limit: Maximum number of open connections. 0 means no
+                limit, so concurrency is bounded only by ``connector_limit_per_host``
+            connector_limit_per_host: Maximum number of open connections to the
+                API host. 0 means no limit
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            dns_cache_ttl: Seconds resolved host addresses are cached
+            backoff_max: Upper bound on the delay between retries in seconds
+            credits_ttl: Seconds a ``get_credits`` result is reused for. Any
+                image request made through this client invalidates it. 0
+                disables caching
+            transport: HTTP library to send requests with: ``"aiohttp"``, or
+                ``"httpx"`` to multiplex concurrent requests over HTTP/2
+                connections (needs the ``http2`` extra). Inferred from
+                ``session`` when one is given
+            validate_responses: Validate API responses against their models.
+                ``False`` builds them with ``model_construct`` instead, which
+                skips validation entirely, so values keep their JSON types
+                (e.g. ids and timestamps stay strings); only use it against
+                endpoints whose responses are known to be well formed. None
+                reads the ``VISCRIBE_VALIDATE_RESPONSES`` environment variable,
+                where ``0`` or ``false`` turns validation off
+            cache_ttl: Seconds a cached image response stays valid. None keeps
+                entries until they are evicted
+            cache: Existing ``ResponseCache`` to use instead of creating one
+                from ``cache_size`` and ``cache_ttl``, e.g. to share it
+                between clients
+            max_payload_bytes: Largest decoded image size in bytes that is
+                uploaded. Bigger images raise ValueError before any network
+                call. None disables the check
+            compress: Gzip image request bodies larger than 4 KB and send them
+                with ``Content-Encoding: gzip``
+
+        The connector arguments are ignored when ``session`` is given.
         """
-        logger.info("🔑 Initializing AsyncClient")
-
-        # Try to get API key from environment if not provided
-        if api_key is None:
-            from os import getenv
-
-            api_key = getenv("VISCRIBE_API_KEY")
-            if not api_key:
-                raise ValueError(
-                    "VISCRIBE_API_KEY not provided and not found in environment"
-                )
-
-        validate_api_key(api_key)
-        logger.debug(
-            f"🛠️ Configuration: verify_ssl={verify_ssl}, timeout={timeout}, max_retries={max_retries}"
+        super().__init__(
+            api_key,
+            verify_ssl,
+            timeout,
+            max_retries,
+            retry_delay,
+            cache_size,
+            validate_responses,
+            cache_ttl,
+            cache,
+            max_payload_bytes,
+            compress,
         )
-        self.api_key = api_key
-        self.headers = {**DEFAULT_HEADERS, "VISCRIBE-APIKEY": api_key}
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
+        self.backoff_max = backoff_max
+        self.coalesce_requests = coalesce_requests
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
+        self.credits_ttl = credits_ttl
+        self._credits: Optional[Tuple[float, CreditsResponse]] = None
+        self._credits_inflight: Optional["asyncio.Future[CreditsResponse]"] = None
+        # Flipped off the first time the server does not know the batch route
+        self._bulk_compare_supported = True
+
+        if session is not None and httpx is not None:
+            if isinstance(session, httpx.AsyncClient):
+                transport = "httpx"
+        if transport not in ("aiohttp", "httpx"):
+            raise ValueError("transport must be 'aiohttp' or 'httpx'")
+        if transport == "httpx" and httpx is None:
+            raise ImportError(
+                'The httpx transport needs the http2 extra: pip install "viscribe[http2]"'
+            )
+        self.transport = transport
 
-        ssl = None if verify_ssl else False
         self.timeout = ClientTimeout(total=timeout) if timeout is not None else None
-
-        self.session = ClientSession(
-            headers=self.headers, connector=TCPConnector(ssl=ssl), timeout=self.timeout
-        )
+        self._timeout_seconds = timeout
+
+        self.session: Optional[Any] = session
+        if session is not None:
+            # Shared sessions carry no client-specific defaults, so send the
+            # auth headers and timeout with every request instead
+            self._owns_session = False
+            self._request_kwargs = {"headers": self.headers}
+            if transport == "httpx":
+                self._request_kwargs["timeout"] = timeout
+            elif self.timeout is not None:
+                self._request_kwargs["timeout"] = self.timeout
+        else:
+            # The session itself is only created on first use, inside a
+            # running event loop
+            self._owns_session = True
+            self._connector_kwargs: Dict[str, Any] = {
+                "ssl": _SSL_CTX if verify_ssl else False,
+                "limit": connector_limit,
+                "limit_per_host": connector_limit_per_host,
+                "ttl_dns_cache": dns_cache_ttl,
+                "keepalive_timeout": keepalive_timeout,
+                "happy_eyeballs_delay": 0.1,
+            }
 
         logger.info("✅ AsyncClient initialized successfully")
 
-    async def _make_request(self, method: str, url: str, **kwargs) -> Any:
-        """Make HTTP request with retry logic."""
+    def _ensure_session(self) -> Any:
+        """Return the session, creating the client's own one if needed."""
+        if self.session is None:
+            logger.debug("🔌 Opening AsyncClient session (%s)", self.transport)
+            if self.transport == "httpx":
+                limit = self._connector_kwargs["limit_per_host"]
+                self.session = httpx.AsyncClient(
+                    http2=True,
+                    headers=self.headers,
+                    # httpcore sets ALPN (h2) on the context it is given, so
+                    # it must not get the shared one aiohttp clients use
+                    verify=self._connector_kwargs["ssl"] is not False,
+                    timeout=self._timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=limit or None,
+                        max_keepalive_connections=100,
+                        keepalive_expiry=self._connector_kwargs["keepalive_timeout"],
+                    ),
+                )
+            else:
+                self.session = ClientSession(
+                    headers=self.headers,
+                    connector=TCPConnector(**self._connector_kwargs),
+                    timeout=self.timeout,
+                )
+        return self.session
+
+    async def _send(
+        self, method: str, url: URL, **kwargs
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send one request and return its status, headers and body."""
+        session = self._ensure_session()
+        # kwargs win over the defaults, e.g. headers of a compressed body
+        kwargs = {**self._request_kwargs, **kwargs}
+        if self.transport == "aiohttp":
+            async with session.request(method, url, **kwargs) as response:
+                return (
+                    response.status,
+                    response.headers,
+                    await read_async_response(response),
+                )
+
+        # Map httpx failures onto the aiohttp errors the retry loop handles
+        try:
+            response = await session.request(
+                method,
+                str(url),
+                content=kwargs.pop("data", None),
+                **kwargs,
+            )
+        except (
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.RemoteProtocolError,
+        ) as e:
+            raise ClientConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise ClientError(str(e)) from e
+        return response.status_code, response.headers, response.content
+
+    async def _make_request(
+        self,
+        method: str,
+        url: URL,
+        response_adapter: Optional[TypeAdapter] = None,
+        **kwargs,
+    ) -> Any:
+        """Make HTTP request with retry logic.
+
+        With a ``response_adapter`` the validated response model is returned
+        instead of the decoded JSON.
+        """
         for attempt in range(self.max_retries):
+            last_attempt = attempt == self.max_retries - 1
             try:
                 logger.info(
-                    f"🚀 Making {method} request to {url} (Attempt {attempt + 1}/{self.max_retries})"
+                    "🚀 Making %s request to %s (Attempt %s/%s)",
+                    method,
+                    url,
+                    attempt + 1,
+                    self.max_retries,
                 )
-                logger.debug(f"🔍 Request parameters: {kwargs}")
-
-                async with self.session.request(method, url, **kwargs) as response:
-                    logger.debug(f"📥 Response status: {response.status}")
-                    result = await handle_async_response(response)
-                    logger.info(f"✅ Request completed successfully: {method} {url}")
+                if logger.is_enabled_for(logging.DEBUG):
+                    logger.debug(
+                        "🔍 Request parameters: %s", redact_request_kwargs(kwargs)
+                    )
+
+                status, headers, body = await self._send(method, url, **kwargs)
+                logger.debug("📥 Response status: %s", status)
+                if last_attempt or status not in RETRYABLE_STATUS_CODES:
+                    result = parse_response_body(status, body, response_adapter)
+                    logger.info("✅ Request completed successfully: %s %s", method, url)
                     return result
-
-            except ClientError as e:
-                logger.warning(f"⚠️ Request attempt {attempt + 1} failed: {str(e)}")
-                if hasattr(e, "status") and e.status is not None:
-                    try:
-                        error_data = await e.response.json()
-                        error_msg = error_data.get("error", str(e))
-                        logger.error(f"🔴 API Error: {error_msg}")
-                        raise APIError(error_msg, status_code=e.status)
-                    except ValueError:
-                        logger.error("🔴 Could not parse error response")
-                        raise APIError(
-                            str(e),
-                            status_code=e.status if hasattr(e, "status") else None,
-                        )
-
-                if attempt == self.max_retries - 1:
-                    logger.error(f"❌ All retry attempts failed for {method} {url}")
+                logger.warning(
+                    "⚠️ Request attempt %s failed with status %s", attempt + 1, status
+                )
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+
+            except (ClientConnectionError, asyncio.TimeoutError) as e:
+                # Dropped connections and timeouts are transient, so retry them
+                logger.warning("⚠️ Request attempt %s failed: %s", attempt + 1, e)
+                if last_attempt:
+                    logger.error(
+                        "❌ All retry attempts failed for %s %s", method, url
+                    )
                     raise ConnectionError(f"Failed to connect to API: {str(e)}")
+                retry_after = None
 
-                retry_delay = self.retry_delay * (attempt + 1)
-                logger.info(f"⏳ Waiting {retry_delay}s before retry {attempt + 2}")
-                await asyncio.sleep(retry_delay)
+            except ClientResponseError as e:
+                # Error bodies are parsed from the response itself; this only
+                # covers responses aiohttp rejected before we could read them
+                logger.error("🔴 API Error: %s", e.message)
+                raise APIError(e.message, status_code=e.status)
+
+            except ClientError as e:
+                logger.error("❌ Request failed: %s", e)
+                raise ConnectionError(f"Failed to connect to API: {str(e)}")
+
+            # Wait at least as long as the server asked before retrying
+            retry_delay = max(retry_after or 0.0, self._backoff_delay(attempt))
+            logger.info("⏳ Waiting %.2fs before retry %s", retry_delay, attempt + 2)
+            await asyncio.sleep(retry_delay)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Delay before the retry following the given zero-based attempt."""
+        return backoff_delay(attempt, self.retry_delay, self.backoff_max)
+
+    async def _post_image_request(
+        self, url: URL, body: bytes, response_adapter: TypeAdapter
+    ) -> Any:
+        """POST an image request, serving it from the cache or an identical in-flight call when possible."""
+        key = None
+        if self._cache is not None or self.coalesce_requests:
+            # Hashing a multi-MB body is not free, so only pay for it when used
+            key = make_cache_key(url, body, self.api_key)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info("💾 Cache hit for %s", url)
+                return cached
+
+        if not self.coalesce_requests:
+            result = await self._make_request(
+                "POST", url, response_adapter, **self._body_kwargs(body)
+            )
+        else:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                inflight = asyncio.ensure_future(
+                    self._make_request(
+                        "POST", url, response_adapter, **self._body_kwargs(body)
+                    )
+                )
+                inflight.add_done_callback(
+                    functools.partial(self._clear_inflight, key)
+                )
+                self._inflight[key] = inflight
+            else:
+                logger.debug("🔗 Joining in-flight request to %s", url)
+            # Shield so that one cancelled caller does not cancel the shared request
+            result = await asyncio.shield(inflight)
+
+        # Image requests spend credits
+        self._credits = None
+        if self._cache is not None:
+            self._cache.set(key, result)
+        return result
+
+    def _clear_inflight(
+        self, key: Tuple[str, str], future: "asyncio.Future[Any]"
+    ) -> None:
+        self._inflight.pop(key, None)
+        # Retrieve the outcome, so a request whose callers were all cancelled
+        # does not log "exception was never retrieved"
+        if not future.cancelled():
+            future.exception()
+
+    def _url(self, path: str) -> URL:
+        return _URLS[path]
+
+    async def _call(self, path: str, req: BaseModel) -> Any:
+        """Send a built request model to the image endpoint at path."""
+        return await self._post_image_request(*self._prepare_call(path, req))
 
     async def submit_feedback(self, request_id: str, rating: int, feedback_text: Optional[str] = None) -> FeedbackResponse:
         """Submit feedback for a request"""
-        logger.info(f"📝 Submitting feedback for request {request_id}")
-        feedback = FeedbackRequest(
-            request_id=request_id, rating=rating, feedback_text=feedback_text
+        logger.info("📝 Submitting feedback for request %s", request_id)
+        req = self._feedback_request(request_id, rating, feedback_text)
+        body = self._encode_request(req)
+        response_adapter = self._response_adapters[FeedbackResponse]
+        return await self._make_request(
+            "POST", self._url("feedback"), response_adapter, data=body
         )
-        payload = feedback.model_dump(exclude_none=True)
-        result = await self._make_request("POST", f"{API_BASE_URL}/feedback", json=payload)
-        return FeedbackResponse(**result)
 
-    async def get_credits(self) -> CreditsResponse:
-        """Get credits information"""
+    async def get_credits(self, force: bool = False) -> CreditsResponse:
+        """Get credits information
+
+        Results are reused for ``credits_ttl`` seconds, and concurrent calls
+        share a single HTTP request.
+
+        Args:
+            force: Fetch fresh credits information even if a cached one is valid
+        """
         logger.info("💳 Fetching credits information")
-        result = await self._make_request("GET", f"{API_BASE_URL}/credits")
-        return CreditsResponse(**result)
+        if (
+            not force
+            and self._credits is not None
+            and time.monotonic() - self._credits[0] < self.credits_ttl
+        ):
+            logger.debug("💾 Using cached credits information")
+            return self._credits[1]
+
+        if self._credits_inflight is None:
+            self._credits_inflight = asyncio.ensure_future(self._fetch_credits())
+            self._credits_inflight.add_done_callback(self._clear_credits_inflight)
+        # Shield so that one cancelled caller does not cancel the shared request
+        return await asyncio.shield(self._credits_inflight)
+
+    async def _fetch_credits(self) -> CreditsResponse:
+        response_adapter = self._response_adapters[CreditsResponse]
+        result = await self._make_request(
+            "GET", self._url("credits"), response_adapter
+        )
+        if self.credits_ttl > 0:
+            self._credits = (time.monotonic(), result)
+        return result
+
+    def _clear_credits_inflight(self, _: "asyncio.Future[CreditsResponse]") -> None:
+        self._credits_inflight = None
 
     async def close(self):
         """Close the session to free up resources"""
+        if not self._owns_session:
+            logger.debug("🔓 Leaving shared session open")
+            return
+        if self.session is None:
+            return
         logger.info("🔒 Closing AsyncClient session")
-        await self.session.close()
+        if self.transport == "httpx":
+            await self.session.aclose()
+        else:
+            await self.session.close()
+        self.session = None
         logger.debug("✅ Session closed successfully")
 
     async def __aenter__(self):
+        self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -172,38 +481,40 @@ class AsyncClient:
 
     async def describe_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageDescribeRequest] = None,
         image_base64: str = None,
         instruction: str = None,
         generate_tags: bool = True,
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
     ) -> ImageDescribeResponse:
-        """Send a describe image request with explicit arguments and validate with Pydantic."""
+        """Send a describe image request with explicit arguments and validate with Pydantic.
+
+        ``image_url`` may also be a prebuilt ``ImageDescribeRequest``, which is sent as-is.
+        Use ``image_path`` or ``image_bytes`` to send a local file or raw image
+        bytes instead.
+        """
         logger.info("🔍 Starting image describe request")
 
-        req = ImageDescribeRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            instruction=instruction,
-            generate_tags=generate_tags,
-        )
-        payload = req.model_dump(exclude_none=True)
-        result = await self._make_request(
-            "POST", f"{API_BASE_URL}/images/describe", json=payload
+        req = self._describe_request(
+            image_url, image_base64, instruction, generate_tags, image_path, image_bytes
         )
-        return ImageDescribeResponse(**result)
+        return await self._call("images/describe", req)
 
     async def extract_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageExtractRequest] = None,
         image_base64: str = None,
         fields: list = None,
         advanced_schema: Union[dict, BaseModel, Type[BaseModel]] = None,
         instruction: str = None,
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
     ) -> ImageExtractResponse:
         """Send an extract structured data from image request with explicit arguments and validate with Pydantic.
         
         Args:
-            image_url: URL of the image
+            image_url: URL of the image, or a prebuilt ``ImageExtractRequest`` to send as-is
             image_base64: Base64 encoded string of the image
             fields: List of dictionaries with 'name', 'type', and optional 'description' keys.
                    Each field type can be 'text', 'number', 'array_text' (max 5), or 'array_number' (max 5).
@@ -212,105 +523,305 @@ class AsyncClient:
                            or a Pydantic BaseModel class. If a BaseModel is provided, it will be serialized
                            to its JSON schema. Use this for nested structures.
             instruction: Optional instruction to guide the extraction process.
+            image_path: Path to a local image file, sent base64 encoded
+            image_bytes: Raw image bytes, sent base64 encoded
         
         Note: Either fields or advanced_schema must be provided, not both.
         """
         logger.info("🔍 Starting image extract request")
 
-        # Convert dictionaries to ExtractField models if fields are provided
-        validated_fields = None
-        if fields is not None:
-            validated_fields = [ExtractField(**field) if isinstance(field, dict) else field for field in fields]
-
-        # Convert Pydantic BaseModel to JSON schema if advanced_schema is a BaseModel
-        validated_schema = advanced_schema
-        if advanced_schema is not None:
-            if isinstance(advanced_schema, BaseModel):
-                # BaseModel instance
-                validated_schema = advanced_schema.model_json_schema()
-            elif isinstance(advanced_schema, type) and issubclass(advanced_schema, BaseModel):
-                # BaseModel class
-                validated_schema = advanced_schema.model_json_schema()
-
-        req = ImageExtractRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            fields=validated_fields,
-            advanced_schema=validated_schema,
-            instruction=instruction,
+        req = self._extract_request(
+            image_url,
+            image_base64,
+            fields,
+            advanced_schema,
+            instruction,
+            image_path,
+            image_bytes,
         )
-        payload = req.model_dump(exclude_none=True)
-        result = await self._make_request(
-            "POST", f"{API_BASE_URL}/images/extract", json=payload
-        )
-        return ImageExtractResponse(**result)
+        return await self._call("images/extract", req)
 
     async def classify_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageClassifyRequest] = None,
         image_base64: str = None,
         classes: list = None,
         class_descriptions: dict = None,
         instruction: str = None,
         multi_label: bool = False,
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
     ) -> ImageClassifyResponse:
-        """Send an image classify request with explicit arguments and validate with Pydantic."""
+        """Send an image classify request with explicit arguments and validate with Pydantic.
+
+        ``image_url`` may also be a prebuilt ``ImageClassifyRequest``, which is sent as-is.
+        Use ``image_path`` or ``image_bytes`` to send a local file or raw image
+        bytes instead.
+        """
         logger.info("🔍 Starting image classify request")
 
-        req = ImageClassifyRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            classes=classes,
-            class_descriptions=class_descriptions,
-            instruction=instruction,
-            multi_label=multi_label,
+        req = self._classify_request(
+            image_url,
+            image_base64,
+            classes,
+            class_descriptions,
+            instruction,
+            multi_label,
+            image_path,
+            image_bytes,
         )
-        payload = req.model_dump(exclude_none=True)
-        result = await self._make_request(
-            "POST", f"{API_BASE_URL}/images/classify", json=payload
-        )
-        return ImageClassifyResponse(**result)
+        return await self._call("images/classify", req)
 
     async def ask_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageAskRequest] = None,
         image_base64: str = None,
         question: str = None,
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
     ) -> ImageAskResponse:
-        """Send an image VQA (ask) request with explicit arguments and validate with Pydantic."""
+        """Send an image VQA (ask) request with explicit arguments and validate with Pydantic.
+
+        ``image_url`` may also be a prebuilt ``ImageAskRequest``, which is sent as-is.
+        Use ``image_path`` or ``image_bytes`` to send a local file or raw image
+        bytes instead.
+        """
         logger.info("🔍 Starting image ask (VQA) request")
 
-        req = ImageAskRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            question=question,
+        req = self._ask_request(
+            image_url, image_base64, question, image_path, image_bytes
         )
-        payload = req.model_dump(exclude_none=True)
-        result = await self._make_request("POST", f"{API_BASE_URL}/images/ask", json=payload)
-        return ImageAskResponse(**result)
+        return await self._call("images/ask", req)
 
     async def compare_images(
         self,
-        image1_url: str = None,
+        image1_url: Union[str, ImageCompareRequest] = None,
         image1_base64: str = None,
         image2_url: str = None,
         image2_base64: str = None,
         instruction: str = None,
+        image1_path: Union[str, os.PathLike] = None,
+        image2_path: Union[str, os.PathLike] = None,
+        image1_bytes: bytes = None,
+        image2_bytes: bytes = None,
     ) -> ImageCompareResponse:
-        """Send an image compare request with explicit arguments and validate with Pydantic."""
+        """Send an image compare request with explicit arguments and validate with Pydantic.
+
+        ``image1_url`` may also be a prebuilt ``ImageCompareRequest``, which is sent as-is.
+        Use ``image1_path``/``image2_path`` or ``image1_bytes``/``image2_bytes`` to send
+        local files or raw image bytes instead.
+        """
         logger.info("🔍 Starting image compare request")
 
-        req = ImageCompareRequest(
-            image1_url=image1_url,
-            image1_base64=image1_base64,
-            image2_url=image2_url,
-            image2_base64=image2_base64,
-            instruction=instruction,
+        req = self._compare_request(
+            image1_url,
+            image1_base64,
+            image2_url,
+            image2_base64,
+            instruction,
+            image1_path,
+            image2_path,
+            image1_bytes,
+            image2_bytes,
         )
-        payload = req.model_dump(exclude_none=True)
-        result = await self._make_request(
-            "POST", f"{API_BASE_URL}/images/compare", json=payload
+        return await self._call("images/compare", req)
+
+    async def compare_images_bulk(
+        self,
+        pairs: List[Tuple[str, str]],
+        instruction: str = None,
+        concurrency: int = 32,
+    ) -> List[ImageCompareResponse]:
+        """Compare several image pairs in a single batch request.
+
+        Servers without the batch route answer 404, in which case the pairs are
+        compared with concurrent single requests instead.
+
+        Args:
+            pairs: ``(image1_url, image2_url)`` tuples to compare
+            instruction: Optional instruction applied to every pair
+            concurrency: Maximum number of requests in flight at once when
+                falling back to single requests
+
+        Returns:
+            Responses in the same order as ``pairs``
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        logger.info("📦 Comparing %s image pairs", len(pairs))
+
+        reqs = [
+            self._compare_request(
+                image1_url, None, image2_url, None, instruction, None, None, None, None
+            )
+            for image1_url, image2_url in pairs
+        ]
+
+        if self._bulk_compare_supported:
+            payload = {
+                "pairs": [
+                    req.__pydantic_serializer__.to_python(req, exclude_none=True)
+                    for req in reqs
+                ]
+            }
+            try:
+                result = await self._make_request(
+                    "POST",
+                    self._url("images/compare:batch"),
+                    data=json_dumps(payload),
+                )
+                # Image requests spend credits
+                self._credits = None
+                results = result.get("results") if isinstance(result, dict) else None
+                if not isinstance(results, list) or len(results) != len(reqs):
+                    raise APIError(
+                        "Unexpected batch compare response: expected "
+                        f"{len(reqs)} results"
+                    )
+                response_adapter = self._response_adapters[ImageCompareResponse]
+                return [response_adapter.validate_python(item) for item in results]
+            except APIError as e:
+                if e.status_code != 404:
+                    raise
+                logger.warning(
+                    "⚠️ Batch compare is not available, falling back to single requests"
+                )
+                self._bulk_compare_supported = False
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def compare_one(req: ImageCompareRequest) -> ImageCompareResponse:
+            async with semaphore:
+                return await self.compare_images(req)
+
+        return await asyncio.gather(*(compare_one(req) for req in reqs))
+
+    async def _gather_bounded(
+        self,
+        func: Callable[..., Awaitable[T]],
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int,
+        return_exceptions: bool,
+        **kwargs,
+    ) -> List[Union[T, BaseException]]:
+        """Run ``func`` for every image with at most ``concurrency`` in flight.
+
+        Each image is either a URL or a dict of arguments for ``func``, which
+        take precedence over the shared ``kwargs``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(image: Union[str, Dict[str, Any]]) -> T:
+            call_kwargs = (
+                {**kwargs, **image}
+                if isinstance(image, dict)
+                else {**kwargs, "image_url": image}
+            )
+            async with semaphore:
+                return await func(**call_kwargs)
+
+        return await asyncio.gather(
+            *(run_one(image) for image in images), return_exceptions=return_exceptions
         )
-        return ImageCompareResponse(**result)
 
+    async def describe_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 32,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageDescribeResponse]:
+        """Describe several images concurrently.
 
+        Args:
+            images: URLs of the images to describe, or dicts of per-image
+                ``describe_image`` arguments
+            concurrency: Maximum number of requests in flight at once
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``describe_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Describing %s images", len(images))
+        return await self._gather_bounded(
+            self.describe_image, images, concurrency, return_exceptions, **kwargs
+        )
+
+    async def extract_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 32,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageExtractResponse]:
+        """Extract structured data from several images concurrently.
+
+        Args:
+            images: URLs of the images to extract from, or dicts of per-image
+                ``extract_image`` arguments
+            concurrency: Maximum number of requests in flight at once
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``extract_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Extracting from %s images", len(images))
+        return await self._gather_bounded(
+            self.extract_image, images, concurrency, return_exceptions, **kwargs
+        )
+
+    async def classify_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 32,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageClassifyResponse]:
+        """Classify several images concurrently.
+
+        Args:
+            images: URLs of the images to classify, or dicts of per-image
+                ``classify_image`` arguments
+            concurrency: Maximum number of requests in flight at once
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``classify_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Classifying %s images", len(images))
+        return await self._gather_bounded(
+            self.classify_image, images, concurrency, return_exceptions, **kwargs
+        )
+
+    async def ask_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 32,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageAskResponse]:
+        """Ask the same question about several images concurrently.
+
+        Args:
+            images: URLs of the images to ask about, or dicts of per-image
+                ``ask_image`` arguments
+            concurrency: Maximum number of requests in flight at once
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``ask_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Asking about %s images", len(images))
+        return await self._gather_bounded(
+            self.ask_image, images, concurrency, return_exceptions, **kwargs
+        )
@@ -0,0 +1,410 @@
+import gzip
+import os
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from viscribe.config import DEFAULT_HEADERS, DEFAULT_MAX_PAYLOAD_BYTES
+from viscribe.logger import viscribe_logger as logger
+from viscribe.models.image import (
+    ASK_REQUEST_ADAPTER,
+    CLASSIFY_REQUEST_ADAPTER,
+    COMPARE_REQUEST_ADAPTER,
+    DESCRIBE_REQUEST_ADAPTER,
+    EXTRACT_REQUEST_ADAPTER,
+    FEEDBACK_REQUEST_ADAPTER,
+    RESPONSE_ADAPTERS,
+    UNVALIDATED_RESPONSE_ADAPTERS,
+    FeedbackRequest,
+    ImageAskRequest,
+    ImageAskResponse,
+    ImageClassifyRequest,
+    ImageClassifyResponse,
+    ImageCompareRequest,
+    ImageCompareResponse,
+    ImageDescribeRequest,
+    ImageDescribeResponse,
+    ImageExtractRequest,
+    ImageExtractResponse,
+)
+from viscribe.utils.cache import ResponseCache
+from viscribe.utils.helpers import encode_image, validate_api_key
+
+# JSON schemas of advanced_schema models, generated once per model class.
+# Weak keys let classes created at runtime still be garbage collected.
+_SCHEMA_CACHE: "weakref.WeakKeyDictionary[Type[BaseModel], dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _model_json_schema(model: Type[BaseModel]) -> dict:
+    """Return the JSON schema of a model class, cached per class."""
+    schema = _SCHEMA_CACHE.get(model)
+    if schema is None:
+        schema = _SCHEMA_CACHE[model] = model.model_json_schema()
+    return schema
+
+
+# Image endpoint API path -> response model
+_ENDPOINTS: Dict[str, Type[BaseModel]] = {
+    "images/describe": ImageDescribeResponse,
+    "images/extract": ImageExtractResponse,
+    "images/classify": ImageClassifyResponse,
+    "images/ask": ImageAskResponse,
+    "images/compare": ImageCompareResponse,
+}
+
+# Every API path the clients send requests to
+API_PATHS: Tuple[str, ...] = (
+    "feedback",
+    "credits",
+    "images/compare:batch",
+    *_ENDPOINTS,
+)
+
+# Bodies smaller than this are sent as is; gzip overhead outweighs the savings
+_COMPRESS_MIN_BYTES = 4096
+
+
+class BaseClient(ABC):
+    """Configuration and request building shared by Client and AsyncClient.
+
+    Subclasses only add the transport: how a request payload is sent and how
+    the response is read back.
+    """
+
+    @classmethod
+    def from_env(
+        cls,
+        verify_ssl: bool = True,
+        timeout: Optional[float] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        **kwargs,
+    ):
+        """Initialize the client using API key from environment variable.
+
+        Args:
+            verify_ssl: Whether to verify SSL certificates
+            timeout: Request timeout in seconds. None means no timeout (infinite)
+            max_retries: Maximum number of retry attempts
+            retry_delay: Delay between retries in seconds
+            **kwargs: Any other client constructor argument
+        """
+        api_key = os.getenv("VISCRIBE_API_KEY")
+        if not api_key:
+            raise ValueError("VISCRIBE_API_KEY environment variable not set")
+        return cls(
+            api_key=api_key,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            **kwargs,
+        )
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        verify_ssl: bool,
+        timeout: Optional[float],
+        max_retries: int,
+        retry_delay: float,
+        cache_size: int,
+        validate_responses: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        max_payload_bytes: Optional[int] = DEFAULT_MAX_PAYLOAD_BYTES,
+        compress: bool = False,
+    ):
+        logger.info("🔑 Initializing %s", type(self).__name__)
+
+        # Try to get API key from environment if not provided
+        if api_key is None:
+            api_key = os.getenv("VISCRIBE_API_KEY")
+            if not api_key:
+                raise ValueError(
+                    "VISCRIBE_API_KEY not provided and not found in environment"
+                )
+
+        validate_api_key(api_key)
+        logger.debug(
+            "🛠️ Configuration: verify_ssl=%s, timeout=%s, max_retries=%s",
+            verify_ssl,
+            timeout,
+            max_retries,
+        )
+
+        self.api_key = api_key
+        self.headers = {**DEFAULT_HEADERS, "VISCRIBE-APIKEY": api_key}
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        if cache is None and cache_size > 0:
+            cache = ResponseCache(cache_size, cache_ttl)
+        self._cache = cache
+        self.max_payload_bytes = max_payload_bytes
+        self.compress = compress
+        if validate_responses is None:
+            validate_responses = os.getenv(
+                "VISCRIBE_VALIDATE_RESPONSES", "1"
+            ).lower() not in ("0", "false", "no")
+        self.validate_responses = validate_responses
+        # Response model -> validator used to parse that response
+        self._response_adapters = (
+            RESPONSE_ADAPTERS if validate_responses else UNVALIDATED_RESPONSE_ADAPTERS
+        )
+        # Keyword arguments sent with every request, filled in by the subclass
+        self._request_kwargs: Dict[str, Any] = {}
+
+    def _image_base64(
+        self,
+        image_url: Optional[str],
+        image_base64: Optional[str],
+        image_path: Optional[Union[str, os.PathLike]],
+        image_bytes: Optional[bytes],
+        name: str = "image",
+    ) -> Optional[str]:
+        """Check that exactly one image source is given and return its base64 payload.
+
+        Missing or ambiguous images are rejected before any file or network I/O.
+        """
+        sources = (image_url, image_base64, image_path, image_bytes)
+        given = sum(bool(source) for source in sources)
+        if given != 1:
+            names = f"{name}_url, {name}_base64, {name}_path or {name}_bytes"
+            if given == 0:
+                raise ValueError(f"Either {names} must be provided.")
+            raise ValueError(f"Provide only one of {names}.")
+        if self.max_payload_bytes is not None:
+            # Sized before reading or encoding anything
+            if image_path:
+                source, size = "path", os.path.getsize(image_path)
+            elif image_bytes:
+                source, size = "bytes", len(image_bytes)
+            else:
+                # Decoded size, from the base64 length without decoding it
+                source, size = "base64", len(image_base64 or "") * 3 // 4
+            if size > self.max_payload_bytes:
+                raise ValueError(
+                    f"{name}_{source} is larger than max_payload_bytes "
+                    f"({self.max_payload_bytes} bytes)"
+                )
+        return encode_image(image_base64, image_path, image_bytes)
+
+    def _check_payload_size(self, req: BaseModel) -> None:
+        """Reject prebuilt requests whose images exceed ``max_payload_bytes``."""
+        if self.max_payload_bytes is None:
+            return
+        for field in ("image_base64", "image1_base64", "image2_base64"):
+            image_base64 = getattr(req, field, None)
+            # Decoded size, from the base64 length without decoding it
+            if image_base64 and len(image_base64) * 3 // 4 > self.max_payload_bytes:
+                raise ValueError(
+                    f"{field} is larger than max_payload_bytes "
+                    f"({self.max_payload_bytes} bytes)"
+                )
+
+    def _body_kwargs(self, body: bytes) -> Dict[str, Any]:
+        """Request kwargs sending body, gzipped when compression is on and pays off."""
+        if not self.compress or len(body) < _COMPRESS_MIN_BYTES:
+            return {"data": body}
+        headers = {
+            **self._request_kwargs.get("headers", {}),
+            "Content-Encoding": "gzip",
+        }
+        # Level 1: base64 barely compresses, so spend as little CPU as possible
+        return {"data": gzip.compress(body, compresslevel=1), "headers": headers}
+
+    @staticmethod
+    def _encode_request(req: BaseModel) -> bytes:
+        """Serialize a request model to a JSON body, leaving out unset fields."""
+        # The core serializer returns bytes directly, skipping the model_dump_json
+        # wrapper and the str round-trip
+        # Bodies are deliberately not streamed: encoding the base64 str to bytes
+        # copies it anyway, and a one-piece body can be resent on retry, hashed
+        # for the cache and gzipped, which a consumed generator cannot
+        return req.__pydantic_serializer__.to_json(req, exclude_none=True)
+
+    @abstractmethod
+    def _url(self, path: str) -> Any:
+        """Return the full URL of an API path, in the type the transport sends."""
+
+    def _prepare_call(
+        self, path: str, req: BaseModel
+    ) -> Tuple[Any, bytes, TypeAdapter]:
+        """Encode a request model for the image endpoint at path.
+
+        Returns the endpoint URL, the JSON body and the adapter parsing the
+        response, for the subclass to send.
+        """
+        response_adapter = self._response_adapters[_ENDPOINTS[path]]
+        return self._url(path), self._encode_request(req), response_adapter
+
+    def _describe_request(
+        self,
+        image_url: Union[str, ImageDescribeRequest],
+        image_base64: Optional[str],
+        instruction: Optional[str],
+        generate_tags: bool,
+        image_path: Optional[Union[str, os.PathLike]],
+        image_bytes: Optional[bytes],
+    ) -> ImageDescribeRequest:
+        if isinstance(image_url, ImageDescribeRequest):
+            # Prebuilt request models were already validated on construction
+            self._check_payload_size(image_url)
+            return image_url
+        image_base64 = self._image_base64(
+            image_url, image_base64, image_path, image_bytes
+        )
+        return DESCRIBE_REQUEST_ADAPTER.validate_python(
+            {
+                "image_url": image_url,
+                "image_base64": image_base64,
+                "instruction": instruction,
+                "generate_tags": generate_tags,
+            }
+        )
+
+    def _extract_request(
+        self,
+        image_url: Union[str, ImageExtractRequest],
+        image_base64: Optional[str],
+        fields: Optional[list],
+        advanced_schema: Union[dict, BaseModel, Type[BaseModel], None],
+        instruction: Optional[str],
+        image_path: Optional[Union[str, os.PathLike]],
+        image_bytes: Optional[bytes],
+    ) -> ImageExtractRequest:
+        if isinstance(image_url, ImageExtractRequest):
+            # Prebuilt request models were already validated on construction
+            self._check_payload_size(image_url)
+            return image_url
+        if not fields and not advanced_schema:
+            raise ValueError("Either 'fields' or 'advanced_schema' must be provided")
+        if fields and advanced_schema:
+            raise ValueError("Provide either 'fields' or 'advanced_schema', not both")
+        image_base64 = self._image_base64(
+            image_url, image_base64, image_path, image_bytes
+        )
+
+        # Convert Pydantic BaseModel to JSON schema if advanced_schema is a BaseModel
+        validated_schema = advanced_schema
+        if advanced_schema is not None:
+            if isinstance(advanced_schema, BaseModel):
+                # BaseModel instance
+                validated_schema = _model_json_schema(type(advanced_schema))
+            elif isinstance(advanced_schema, type) and issubclass(
+                advanced_schema, BaseModel
+            ):
+                # BaseModel class
+                validated_schema = _model_json_schema(advanced_schema)
+
+        return EXTRACT_REQUEST_ADAPTER.validate_python(
+            {
+                "image_url": image_url,
+                "image_base64": image_base64,
+                # Dicts and ExtractField models are both validated by the
+                # request's compiled list validator in a single pass
+                "fields": fields,
+                "advanced_schema": validated_schema,
+                "instruction": instruction,
+            }
+        )
+
+    def _classify_request(
+        self,
+        image_url: Union[str, ImageClassifyRequest],
+        image_base64: Optional[str],
+        classes: Optional[list],
+        class_descriptions: Optional[dict],
+        instruction: Optional[str],
+        multi_label: bool,
+        image_path: Optional[Union[str, os.PathLike]],
+        image_bytes: Optional[bytes],
+    ) -> ImageClassifyRequest:
+        if isinstance(image_url, ImageClassifyRequest):
+            # Prebuilt request models were already validated on construction
+            self._check_payload_size(image_url)
+            return image_url
+        image_base64 = self._image_base64(
+            image_url, image_base64, image_path, image_bytes
+        )
+        return CLASSIFY_REQUEST_ADAPTER.validate_python(
+            {
+                "image_url": image_url,
+                "image_base64": image_base64,
+                "classes": classes,
+                "class_descriptions": class_descriptions,
+                "instruction": instruction,
+                "multi_label": multi_label,
+            }
+        )
+
+    def _ask_request(
+        self,
+        image_url: Union[str, ImageAskRequest],
+        image_base64: Optional[str],
+        question: Optional[str],
+        image_path: Optional[Union[str, os.PathLike]],
+        image_bytes: Optional[bytes],
+    ) -> ImageAskRequest:
+        if isinstance(image_url, ImageAskRequest):
+            # Prebuilt request models were already validated on construction
+            self._check_payload_size(image_url)
+            return image_url
+        image_base64 = self._image_base64(
+            image_url, image_base64, image_path, image_bytes
+        )
+        return ASK_REQUEST_ADAPTER.validate_python(
+            {
+                "image_url": image_url,
+                "image_base64": image_base64,
+                "question": question,
+            }
+        )
+
+    def _compare_request(
+        self,
+        image1_url: Union[str, ImageCompareRequest],
+        image1_base64: Optional[str],
+        image2_url: Optional[str],
+        image2_base64: Optional[str],
+        instruction: Optional[str],
+        image1_path: Optional[Union[str, os.PathLike]],
+        image2_path: Optional[Union[str, os.PathLike]],
+        image1_bytes: Optional[bytes],
+        image2_bytes: Optional[bytes],
+    ) -> ImageCompareRequest:
+        if isinstance(image1_url, ImageCompareRequest):
+            # Prebuilt request models were already validated on construction
+            self._check_payload_size(image1_url)
+            return image1_url
+        image1_base64 = self._image_base64(
+            image1_url, image1_base64, image1_path, image1_bytes, "image1"
+        )
+        image2_base64 = self._image_base64(
+            image2_url, image2_base64, image2_path, image2_bytes, "image2"
+        )
+        return COMPARE_REQUEST_ADAPTER.validate_python(
+            {
+                "image1_url": image1_url,
+                "image1_base64": image1_base64,
+                "image2_url": image2_url,
+                "image2_base64": image2_base64,
+                "instruction": instruction,
+            }
+        )
+
+    @staticmethod
+    def _feedback_request(
+        request_id: str, rating: int, feedback_text: Optional[str]
+    ) -> FeedbackRequest:
+        return FEEDBACK_REQUEST_ADAPTER.validate_python(
+            {
+                "request_id": request_id,
+                "rating": rating,
+                "feedback_text": feedback_text,
+            }
+        )
@@ -1,59 +1,66 @@
 # Client implementation goes here
-from typing import Any, Optional, Type, Union
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 import requests
 import urllib3
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
-from viscribe.config import API_BASE_URL, DEFAULT_HEADERS
+from viscribe.base_client import API_PATHS, BaseClient
+from viscribe.config import (
+    API_BASE_URL,
+    DEFAULT_MAX_PAYLOAD_BYTES,
+    RETRYABLE_STATUS_CODES,
+)
 from viscribe.exceptions import APIError
 from viscribe.logger import viscribe_logger as logger
-from viscribe.models.image import CreditsResponse, FeedbackRequest, FeedbackResponse
 from viscribe.models.image import (
-    ExtractField,
+    CreditsResponse,
+    FeedbackResponse,
+    ImageAskRequest,
+    ImageAskResponse,
+    ImageClassifyRequest,
+    ImageClassifyResponse,
+    ImageCompareRequest,
+    ImageCompareResponse,
     ImageDescribeRequest,
     ImageDescribeResponse,
     ImageExtractRequest,
     ImageExtractResponse,
-    ImageClassifyRequest,
-    ImageClassifyResponse,
-    ImageAskRequest,
-    ImageAskResponse,
-    ImageCompareRequest, ImageCompareResponse
 )
-from viscribe.utils.helpers import handle_sync_response, validate_api_key
+from viscribe.utils.cache import ResponseCache, make_cache_key
+from viscribe.utils.helpers import (
+    error_message,
+    handle_sync_response,
+    redact_request_kwargs,
+)
+
+T = TypeVar("T")
+
+# API path -> full URL, built once at import instead of formatted on every call
+_URLS: Dict[str, str] = {path: f"{API_BASE_URL}/{path}" for path in API_PATHS}
 
 
-class Client:
+class Client(BaseClient):
     @classmethod
-    def from_env(
-        cls,
-        verify_ssl: bool = True,
-        timeout: Optional[float] = None,
-        max_retries: int = 3,
-        retry_delay: float = 1.0,
-    ):
-        """Initialize Client using API key from environment variable.
+    def from_session(cls, session: requests.Session, api_key: str = None, **kwargs):
+        """Initialize Client on top of an existing requests session.
+
+        Several clients can then share one connection pool instead of each
+        opening its own connections.
 
         Args:
-            verify_ssl: Whether to verify SSL certificates
-            timeout: Request timeout in seconds. None means no timeout (infinite)
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            session: requests session to send requests with
+            api_key: API key for authentication. If None, will try to load from environment
+            **kwargs: Any other Client constructor argument
         """
-        from os import getenv
-
-        api_key = getenv("VISCRIBE_API_KEY")
-        if not api_key:
-            raise ValueError("VISCRIBE_API_KEY environment variable not set")
-        return cls(
-            api_key=api_key,
-            verify_ssl=verify_ssl,
-            timeout=timeout,
-            max_retries=max_retries,
-            retry_delay=retry_delay,
-        )
+        return cls(api_key=api_key, session=session, **kwargs)
 
     def __init__(
         self,
@@ -62,6 +69,16 @@ class Client:
         timeout: Optional[float] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        cache_size: int = 0,
+        session: Optional[requests.Session] = None,
+        validate_responses: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        max_payload_bytes: Optional[int] = DEFAULT_MAX_PAYLOAD_BYTES,
+        compress: bool = False,
+        pool_maxsize: int = 100,
+        backoff_max: float = 30.0,
+        credits_ttl: float = 5.0,
     ):
         """Initialize Client with configurable parameters.
 
@@ -70,46 +87,100 @@ class Client:
             verify_ssl: Whether to verify SSL certificates
             timeout: Request timeout in seconds. None means no timeout (infinite)
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds. Retries back off
+                exponentially from it, with random jitter
+            cache_size: Number of image responses to keep in an in-memory LRU
+                cache. Identical requests are then answered without a network
+                call. 0 disables caching
+            session: Existing requests session to reuse. Its adapters are left
+                untouched and it is not closed by ``close()``; its owner is
+                responsible for that
+            validate_responses: Validate API responses against their models.
+                ``False`` builds them with ``model_construct`` instead, which
+                skips validation entirely, so values keep their JSON types
+                (e.g. ids and timestamps stay strings); only use it against
+                endpoints whose responses are known to be well formed. None
+                reads the ``VISCRIBE_VALIDATE_RESPONSES`` environment variable,
+                where ``0`` or ``false`` turns validation off
+            cache_ttl: Seconds a cached image response stays valid. None keeps
+                entries until they are evicted
+            cache: Existing ``ResponseCache`` to use instead of creating one
+                from ``cache_size`` and ``cache_ttl``, e.g. to share it
+                between clients
+            max_payload_bytes: Largest decoded image size in bytes that is
+                uploaded. Bigger images raise ValueError before any network
+                call. None disables the check
+            compress: Gzip image request bodies larger than 4 KB and send them
+                with ``Content-Encoding: gzip``
+            pool_maxsize: Number of connections to the API kept open for reuse,
+                so that many threads can call the client without opening new
+                connections. Ignored when ``session`` is given
+            backoff_max: Upper bound on the delay between retries in seconds
+            credits_ttl: Seconds a ``get_credits`` result is reused for. Any
+                image request made through this client invalidates it. 0
+                disables caching
         """
-        logger.info("🔑 Initializing Client")
-
-        # Try to get API key from environment if not provided
-        if api_key is None:
-            from os import getenv
-
-            api_key = getenv("VISCRIBE_API_KEY")
-            if not api_key:
-                raise ValueError(
-                    "VISCRIBE_API_KEY not provided and not found in environment"
-                )
-
-        validate_api_key(api_key)
-        logger.debug(
-            f"🛠️ Configuration: verify_ssl={verify_ssl}, timeout={timeout}, max_retries={max_retries}"
+        super().__init__(
+            api_key,
+            verify_ssl,
+            timeout,
+            max_retries,
+            retry_delay,
+            cache_size,
+            validate_responses,
+            cache_ttl,
+            cache,
+            max_payload_bytes,
+            compress,
         )
-
-        self.api_key = api_key
-        self.headers = {**DEFAULT_HEADERS, "VISCRIBE-APIKEY": api_key}
         self.timeout = timeout
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-
-        # Create a session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
-        self.session.verify = verify_ssl
-
-        # Configure retries
-        adapter = requests.adapters.HTTPAdapter(
-            max_retries=requests.urllib3.Retry(
-                total=max_retries,
-                backoff_factor=retry_delay,
-                status_forcelist=[500, 502, 503, 504],
+        self.credits_ttl = credits_ttl
+        self._credits: Optional[Tuple[float, CreditsResponse]] = None
+        # url -> reusable PreparedRequest and send arguments, see _send
+        self._prepared: Dict[
+            str, Tuple[requests.PreparedRequest, Dict[str, Any]]
+        ] = {}
+
+        if session is not None:
+            # Shared sessions carry no client-specific defaults, so send the
+            # auth headers and SSL setting with every request instead
+            self.session = session
+            self._owns_session = False
+            # The pool size of a shared session is up to its owner
+            self._pool_maxsize: Optional[int] = None
+            self._request_kwargs = {
+                "headers": self.headers,
+                "verify": verify_ssl,
+            }
+        else:
+            # Create a session for connection pooling
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+            self.session.verify = verify_ssl
+            self._owns_session = True
+            self._pool_maxsize = pool_maxsize
+
+            # Configure retries and the connection pool. Every request goes
+            # to one host, so a single large pool is all that is needed
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_maxsize,
+                max_retries=Retry(
+                    total=max_retries,
+                    backoff_factor=retry_delay,
+                    # Jitter keeps many clients from retrying in lockstep
+                    backoff_jitter=retry_delay / 2,
+                    backoff_max=backoff_max,
+                    status_forcelist=RETRYABLE_STATUS_CODES,
+                    # Image requests are safe to repeat
+                    allowed_methods=frozenset({"GET", "POST"}),
+                    respect_retry_after_header=True,
+                    # Hand the last error response back so it becomes an APIError
+                    raise_on_status=False,
+                ),
             )
-        )
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
 
         # Add warning suppression if verify_ssl is False
         if not verify_ssl:
@@ -117,94 +188,163 @@ class Client:
 
         logger.info("✅ Client initialized successfully")
 
-    def _make_request(self, method: str, url: str, **kwargs) -> Any:
-        """Make HTTP request with error handling."""
+    def _make_request(
+        self,
+        method: str,
+        url: str,
+        response_adapter: Optional[TypeAdapter] = None,
+        **kwargs,
+    ) -> Any:
+        """Make HTTP request with error handling.
+
+        With a ``response_adapter`` the response model is validated straight
+        from the raw body and returned instead of the decoded JSON.
+        """
         try:
-            logger.info(f"🚀 Making {method} request to {url}")
-            logger.debug(f"🔍 Request parameters: {kwargs}")
+            logger.info("🚀 Making %s request to %s", method, url)
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug("🔍 Request parameters: %s", redact_request_kwargs(kwargs))
 
-            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
-            logger.debug(f"📥 Response status: {response.status_code}")
+            response = self._send(method, url, **kwargs)
+            logger.debug("📥 Response status: %s", response.status_code)
 
-            result = handle_sync_response(response)
-            logger.info(f"✅ Request completed successfully: {method} {url}")
+            result = handle_sync_response(response, response_adapter)
+            logger.info("✅ Request completed successfully: %s %s", method, url)
             return result
 
         except RequestException as e:
-            logger.error(f"❌ Request failed: {str(e)}")
+            logger.error("❌ Request failed: %s", e)
             if hasattr(e, "response") and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get("error", str(e))
-                    logger.error(f"🔴 API Error: {error_msg}")
-                    raise APIError(error_msg, status_code=e.response.status_code)
-                except ValueError:
-                    logger.error("🔴 Could not parse error response")
-                    raise APIError(
-                        str(e),
-                        status_code=(
-                            e.response.status_code
-                            if hasattr(e.response, "status_code")
-                            else None
-                        ),
-                    )
-            logger.error(f"🔴 Connection Error: {str(e)}")
+                error_msg = error_message(e.response.content, str(e))
+                logger.error("🔴 API Error: %s", error_msg)
+                raise APIError(error_msg, status_code=e.response.status_code)
+            logger.error("🔴 Connection Error: %s", e)
             raise ConnectionError(f"Failed to connect to API: {str(e)}")
 
-    def submit_feedback(self, request_id: str, rating: int, feedback_text: Optional[str] = None) -> FeedbackResponse:
-        """Submit feedback for a request"""
-        logger.info(f"📝 Submitting feedback for request {request_id}")
-        request = FeedbackRequest(
-            request_id=request_id,
-            rating=rating,
-            feedback_text=feedback_text,
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send one request through the session."""
+        if method == "GET" and not kwargs:
+            # Bodiless GETs never change, so build their PreparedRequest once
+            prepared = self._prepared.get(url)
+            if prepared is None:
+                prepared = self._prepared[url] = self._prepare(method, url)
+            request, send_kwargs = prepared
+            return self.session.send(request, **send_kwargs)
+
+        # kwargs win over the defaults, e.g. headers of a compressed body
+        return self.session.request(
+            method, url, timeout=self.timeout, **{**self._request_kwargs, **kwargs}
+        )
+
+    def _prepare(
+        self, method: str, url: str
+    ) -> Tuple[requests.PreparedRequest, Dict[str, Any]]:
+        """Prepare a request and its send arguments the way ``Session.request`` does."""
+        request = self.session.prepare_request(
+            requests.Request(method, url, headers=self._request_kwargs.get("headers"))
         )
-        payload = request.model_dump(exclude_none=True)
+        send_kwargs = self.session.merge_environment_settings(
+            request.url, {}, None, self._request_kwargs.get("verify"), None
+        )
+        send_kwargs.update(timeout=self.timeout, allow_redirects=True)
+        return request, send_kwargs
+
+    def _post_image_request(
+        self, url: str, body: bytes, response_adapter: TypeAdapter
+    ) -> Any:
+        """POST an image request, serving it from the cache when possible."""
+        if self._cache is not None:
+            key = make_cache_key(url, body, self.api_key)
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info("💾 Cache hit for %s", url)
+                return cached
+
         result = self._make_request(
-            "POST", f"{API_BASE_URL}/feedback", json=payload
+            "POST", url, response_adapter, **self._body_kwargs(body)
         )
-        return FeedbackResponse(**result)
+        # Image requests spend credits
+        self._credits = None
+        if self._cache is not None:
+            self._cache.set(key, result)
+        return result
+
+    def _url(self, path: str) -> str:
+        return _URLS[path]
 
-    def get_credits(self) -> CreditsResponse:
-        """Get credits information"""
+    def _call(self, path: str, req: BaseModel) -> Any:
+        """Send a built request model to the image endpoint at path."""
+        return self._post_image_request(*self._prepare_call(path, req))
+
+    def submit_feedback(self, request_id: str, rating: int, feedback_text: Optional[str] = None) -> FeedbackResponse:
+        """Submit feedback for a request"""
+        logger.info("📝 Submitting feedback for request %s", request_id)
+        req = self._feedback_request(request_id, rating, feedback_text)
+        body = self._encode_request(req)
+        response_adapter = self._response_adapters[FeedbackResponse]
+        return self._make_request(
+            "POST", self._url("feedback"), response_adapter, data=body
+        )
+
+    def get_credits(self, force: bool = False) -> CreditsResponse:
+        """Get credits information
+
+        Results are reused for ``credits_ttl`` seconds.
+
+        Args:
+            force: Fetch fresh credits information even if a cached one is valid
+        """
         logger.info("💳 Fetching credits information")
-        result = self._make_request("GET", f"{API_BASE_URL}/credits")
-        return CreditsResponse(**result)
+        if (
+            not force
+            and self._credits is not None
+            and time.monotonic() - self._credits[0] < self.credits_ttl
+        ):
+            logger.debug("💾 Using cached credits information")
+            return self._credits[1]
+
+        response_adapter = self._response_adapters[CreditsResponse]
+        result = self._make_request("GET", self._url("credits"), response_adapter)
+        if self.credits_ttl > 0:
+            self._credits = (time.monotonic(), result)
+        return result
 
     def describe_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageDescribeRequest] = None,
         image_base64: str = None,
         instruction: str = None,
         generate_tags: bool = True,
-    ):
-        """Send a describe image request with explicit arguments and validate with Pydantic."""
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
+    ) -> ImageDescribeResponse:
+        """Send a describe image request with explicit arguments and validate with Pydantic.
+
+        ``image_url`` may also be a prebuilt ``ImageDescribeRequest``, which is sent as-is.
+        Use ``image_path`` or ``image_bytes`` to send a local file or raw image
+        bytes instead.
+        """
         logger.info("🔍 Starting image describe request")
 
-        req = ImageDescribeRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            instruction=instruction,
-            generate_tags=generate_tags,
+        req = self._describe_request(
+            image_url, image_base64, instruction, generate_tags, image_path, image_bytes
         )
-        payload = req.model_dump(exclude_none=True)
-        result = self._make_request(
-            "POST", f"{API_BASE_URL}/images/describe", json=payload
-        )
-        return ImageDescribeResponse(**result)
+        return self._call("images/describe", req)
 
     def extract_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageExtractRequest] = None,
         image_base64: str = None,
         fields: list = None,
         advanced_schema: Union[dict, BaseModel, Type[BaseModel]] = None,
         instruction: str = None,
-    ):
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
+    ) -> ImageExtractResponse:
         """Send an extract structured data from image request with explicit arguments and validate with Pydantic.
         
         Args:
-            image_url: URL of the image
+            image_url: URL of the image, or a prebuilt ``ImageExtractRequest`` to send as-is
             image_base64: Base64 encoded string of the image
             fields: List of dictionaries with 'name', 'type', and optional 'description' keys.
                    Each field type can be 'text', 'number', 'array_text' (max 5), or 'array_number' (max 5).
@@ -213,109 +353,264 @@ class Client:
                            or a Pydantic BaseModel class. If a BaseModel is provided, it will be serialized
                            to its JSON schema. Use this for nested structures.
             instruction: Optional instruction to guide the extraction process.
+            image_path: Path to a local image file, sent base64 encoded
+            image_bytes: Raw image bytes, sent base64 encoded
         
         Note: Either fields or advanced_schema must be provided, not both.
         """
         logger.info("🔍 Starting image extract request")
 
-        # Convert dictionaries to ExtractField models if fields are provided
-        validated_fields = None
-        if fields is not None:
-            validated_fields = [ExtractField(**field) if isinstance(field, dict) else field for field in fields]
-
-        # Convert Pydantic BaseModel to JSON schema if advanced_schema is a BaseModel
-        validated_schema = advanced_schema
-        if advanced_schema is not None:
-            if isinstance(advanced_schema, BaseModel):
-                # BaseModel instance
-                validated_schema = advanced_schema.model_json_schema()
-            elif isinstance(advanced_schema, type) and issubclass(advanced_schema, BaseModel):
-                # BaseModel class
-                validated_schema = advanced_schema.model_json_schema()
-
-        req = ImageExtractRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            fields=validated_fields,
-            advanced_schema=validated_schema,
-            instruction=instruction,
+        req = self._extract_request(
+            image_url,
+            image_base64,
+            fields,
+            advanced_schema,
+            instruction,
+            image_path,
+            image_bytes,
         )
-        payload = req.model_dump(exclude_none=True)
-        result = self._make_request(
-            "POST", f"{API_BASE_URL}/images/extract", json=payload
-        )
-        return ImageExtractResponse(**result)
+        return self._call("images/extract", req)
 
     def classify_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageClassifyRequest] = None,
         image_base64: str = None,
         classes: list = None,
         class_descriptions: dict = None,
         instruction: str = None,
         multi_label: bool = False,
-    ):
-        """Send an image classify request with explicit arguments and validate with Pydantic."""
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
+    ) -> ImageClassifyResponse:
+        """Send an image classify request with explicit arguments and validate with Pydantic.
+
+        ``image_url`` may also be a prebuilt ``ImageClassifyRequest``, which is sent as-is.
+        Use ``image_path`` or ``image_bytes`` to send a local file or raw image
+        bytes instead.
+        """
         logger.info("🔍 Starting image classify request")
 
-        req = ImageClassifyRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            classes=classes,
-            class_descriptions=class_descriptions,
-            instruction=instruction,
-            multi_label=multi_label,
-        )
-        payload = req.model_dump(exclude_none=True)
-        result = self._make_request(
-            "POST", f"{API_BASE_URL}/images/classify", json=payload
+        req = self._classify_request(
+            image_url,
+            image_base64,
+            classes,
+            class_descriptions,
+            instruction,
+            multi_label,
+            image_path,
+            image_bytes,
         )
-        return ImageClassifyResponse(**result)
+        return self._call("images/classify", req)
 
     def ask_image(
         self,
-        image_url: str = None,
+        image_url: Union[str, ImageAskRequest] = None,
         image_base64: str = None,
         question: str = None,
-    ):
-        """Send an image VQA (ask) request with explicit arguments and validate with Pydantic."""
+        image_path: Union[str, os.PathLike] = None,
+        image_bytes: bytes = None,
+    ) -> ImageAskResponse:
+        """Send an image VQA (ask) request with explicit arguments and validate with Pydantic.
+
+        ``image_url`` may also be a prebuilt ``ImageAskRequest``, which is sent as-is.
+        Use ``image_path`` or ``image_bytes`` to send a local file or raw image
+        bytes instead.
+        """
         logger.info("🔍 Starting image ask (VQA) request")
 
-        req = ImageAskRequest(
-            image_url=image_url,
-            image_base64=image_base64,
-            question=question,
+        req = self._ask_request(
+            image_url, image_base64, question, image_path, image_bytes
         )
-        payload = req.model_dump(exclude_none=True)
-        result = self._make_request("POST", f"{API_BASE_URL}/images/ask", json=payload)
-        return ImageAskResponse(**result)
+        return self._call("images/ask", req)
 
     def compare_images(
         self,
-        image1_url: str = None,
+        image1_url: Union[str, ImageCompareRequest] = None,
         image1_base64: str = None,
         image2_url: str = None,
         image2_base64: str = None,
         instruction: str = None,
-    ):
-        """Send an image compare request with explicit arguments and validate with Pydantic."""
+        image1_path: Union[str, os.PathLike] = None,
+        image2_path: Union[str, os.PathLike] = None,
+        image1_bytes: bytes = None,
+        image2_bytes: bytes = None,
+    ) -> ImageCompareResponse:
+        """Send an image compare request with explicit arguments and validate with Pydantic.
+
+        ``image1_url`` may also be a prebuilt ``ImageCompareRequest``, which is sent as-is.
+        Use ``image1_path``/``image2_path`` or ``image1_bytes``/``image2_bytes`` to send
+        local files or raw image bytes instead.
+        """
         logger.info("🔍 Starting image compare request")
 
-        req = ImageCompareRequest(
-            image1_url=image1_url,
-            image1_base64=image1_base64,
-            image2_url=image2_url,
-            image2_base64=image2_base64,
-            instruction=instruction,
+        req = self._compare_request(
+            image1_url,
+            image1_base64,
+            image2_url,
+            image2_base64,
+            instruction,
+            image1_path,
+            image2_path,
+            image1_bytes,
+            image2_bytes,
         )
-        payload = req.model_dump(exclude_none=True)
-        result = self._make_request(
-            "POST", f"{API_BASE_URL}/images/compare", json=payload
+        return self._call("images/compare", req)
+
+    def _map_bounded(
+        self,
+        func: Callable[..., T],
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int,
+        return_exceptions: bool,
+        **kwargs,
+    ) -> List[Union[T, Exception]]:
+        """Run ``func`` for every image on at most ``concurrency`` threads.
+
+        Each image is either a URL or a dict of arguments for ``func``, which
+        take precedence over the shared ``kwargs``. The threads share the
+        session, so the batch reuses its pooled connections.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not images:
+            return []
+        # More threads than pooled connections would only open throwaway ones
+        if self._pool_maxsize is not None:
+            concurrency = min(concurrency, self._pool_maxsize)
+
+        def run_one(image: Union[str, Dict[str, Any]]) -> T:
+            call_kwargs = (
+                {**kwargs, **image}
+                if isinstance(image, dict)
+                else {**kwargs, "image_url": image}
+            )
+            return func(**call_kwargs)
+
+        results: List[Union[T, Exception]] = []
+        executor = ThreadPoolExecutor(max_workers=min(concurrency, len(images)))
+        try:
+            futures = [executor.submit(run_one, image) for image in images]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        finally:
+            # On failure, drop the requests that have not started yet
+            executor.shutdown(cancel_futures=True)
+        return results
+
+    def describe_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 16,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageDescribeResponse]:
+        """Describe several images concurrently on a pool of threads.
+
+        Args:
+            images: URLs of the images to describe, or dicts of per-image
+                ``describe_image`` arguments
+            concurrency: Maximum number of requests in flight at once, capped
+                at the client's ``pool_maxsize``
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``describe_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Describing %s images", len(images))
+        return self._map_bounded(
+            self.describe_image, images, concurrency, return_exceptions, **kwargs
+        )
+
+    def extract_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 16,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageExtractResponse]:
+        """Extract structured data from several images concurrently on a pool of threads.
+
+        Args:
+            images: URLs of the images to extract from, or dicts of per-image
+                ``extract_image`` arguments
+            concurrency: Maximum number of requests in flight at once, capped
+                at the client's ``pool_maxsize``
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``extract_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Extracting from %s images", len(images))
+        return self._map_bounded(
+            self.extract_image, images, concurrency, return_exceptions, **kwargs
+        )
+
+    def classify_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 16,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageClassifyResponse]:
+        """Classify several images concurrently on a pool of threads.
+
+        Args:
+            images: URLs of the images to classify, or dicts of per-image
+                ``classify_image`` arguments
+            concurrency: Maximum number of requests in flight at once, capped
+                at the client's ``pool_maxsize``
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``classify_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Classifying %s images", len(images))
+        return self._map_bounded(
+            self.classify_image, images, concurrency, return_exceptions, **kwargs
+        )
+
+    def ask_images(
+        self,
+        images: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 16,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[ImageAskResponse]:
+        """Ask the same question about several images concurrently on a pool of threads.
+
+        Args:
+            images: URLs of the images to ask about, or dicts of per-image
+                ``ask_image`` arguments
+            concurrency: Maximum number of requests in flight at once, capped
+                at the client's ``pool_maxsize``
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+            **kwargs: Extra arguments passed to ``ask_image`` for every image
+
+        Returns:
+            Responses in the same order as ``images``
+        """
+        logger.info("📦 Asking about %s images", len(images))
+        return self._map_bounded(
+            self.ask_image, images, concurrency, return_exceptions, **kwargs
         )
-        return ImageCompareResponse(**result)
 
     def close(self):
         """Close the session to free up resources"""
+        if not self._owns_session:
+            logger.debug("🔓 Leaving shared session open")
+            return
         logger.info("🔒 Closing Client session")
         self.session.close()
         logger.debug("✅ Session closed successfully")
@@ -4,3 +4,9 @@ DEFAULT_HEADERS = {
     "accept": "application/json",
     "Content-Type": "application/json",
 }
+
+# Transient HTTP statuses worth retrying; other 4xx errors fail immediately
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Largest decoded image uploaded by default; bigger ones are rejected client-side
+DEFAULT_MAX_PAYLOAD_BYTES = 20_000_000
@@ -1,6 +1,6 @@
 import logging
 import logging.handlers
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 # Emoji mappings for different log levels
 LOG_EMOJIS: Dict[int, str] = {
@@ -89,30 +89,37 @@ class ViscribeLogger:
         self.logger.handlers.clear()
         self.enabled = False
 
-    def debug(self, message: str) -> None:
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether a message at level would be emitted.
+
+        Use this to skip building expensive log arguments that would be dropped.
+        """
+        return self.enabled and self.logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args: Any) -> None:
         """Log debug message if logging is enabled"""
         if self.enabled:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log info message if logging is enabled"""
         if self.enabled:
-            self.logger.info(message)
+            self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log warning message if logging is enabled"""
         if self.enabled:
-            self.logger.warning(message)
+            self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log error message if logging is enabled"""
         if self.enabled:
-            self.logger.error(message)
+            self.logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """Log critical message if logging is enabled"""
         if self.enabled:
-            self.logger.critical(message)
+            self.logger.critical(message, *args)
 
 
 # Default logger instance
@@ -1,14 +1,60 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-
-from viscribe.utils.helpers import validate_base64_image, validate_url_format
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+
+from viscribe.utils.helpers import (
+    is_uuid,
+    json_loads,
+    validate_base64_image,
+    validate_url_format,
+)
 
 # 1. Image Endpoints
 
 
+def _validate_image_source(url: Optional[str], b64: Optional[str], name: str = "image"):
+    """Ensure exactly one of an image's URL and base64 is given, in a valid format."""
+    if not url and not b64:
+        raise ValueError(f"Either {name}_url or {name}_base64 must be provided.")
+    if url and b64:
+        raise ValueError(f"Provide either {name}_url or {name}_base64, not both.")
+
+    # Validate URL format if provided
+    if url:
+        try:
+            validate_url_format(url)
+        except ValueError as e:
+            raise ValueError(f"Invalid {name}_url: {str(e)}")
+
+    # Validate base64 format if provided
+    if b64:
+        try:
+            validate_base64_image(b64)
+        except ValueError as e:
+            raise ValueError(f"Invalid {name}_base64: {str(e)}")
+
+
+class ResponseBase(BaseModel):
+    """Base for API responses.
+
+    Responses are frozen: cached and coalesced requests hand the same
+    instance to every caller, so one caller must not be able to change it
+    for the others. Pydantic models keep their fields in ``__dict__``, so
+    there are no ``__slots__`` savings to be had.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
 class ImageSourceBase(BaseModel):
     image_url: Optional[str] = Field(default=None, description="URL of the image.")
     image_base64: Optional[str] = Field(
@@ -19,28 +65,7 @@ class ImageSourceBase(BaseModel):
     @classmethod
     def check_image_source(cls, values):
         """Ensure exactly one image source is provided and validate formats."""
-        url = values.get("image_url")
-        b64 = values.get("image_base64")
-
-        if not url and not b64:
-            raise ValueError("Either image_url or image_base64 must be provided.")
-        if url and b64:
-            raise ValueError("Provide either image_url or image_base64, not both.")
-
-        # Validate URL format if provided
-        if url:
-            try:
-                validate_url_format(url)
-            except ValueError as e:
-                raise ValueError(f"Invalid image_url: {str(e)}")
-
-        # Validate base64 format if provided
-        if b64:
-            try:
-                validate_base64_image(b64)
-            except ValueError as e:
-                raise ValueError(f"Invalid image_base64: {str(e)}")
-
+        _validate_image_source(values.get("image_url"), values.get("image_base64"))
         return values
 
 
@@ -49,7 +74,7 @@ class ImageDescribeRequest(ImageSourceBase):
     generate_tags: bool = True
 
 
-class ImageDescribeResponse(BaseModel):
+class ImageDescribeResponse(ResponseBase):
     request_id: str
     credits_used: int
     image_description: str
@@ -112,7 +137,7 @@ class ImageExtractRequest(ImageSourceBase):
         return self
 
 
-class ImageExtractResponse(BaseModel):
+class ImageExtractResponse(ResponseBase):
     request_id: str
     credits_used: int
     extracted_data: Dict[str, Any]
@@ -125,7 +150,7 @@ class ImageClassifyRequest(ImageSourceBase):
     multi_label: bool = False
 
 
-class ImageClassifyResponse(BaseModel):
+class ImageClassifyResponse(ResponseBase):
     request_id: str
     credits_used: int
     classification: List[str]
@@ -135,7 +160,7 @@ class ImageAskRequest(ImageSourceBase):
     question: str
 
 
-class ImageAskResponse(BaseModel):
+class ImageAskResponse(ResponseBase):
     request_id: str
     credits_used: int
     answer: str
@@ -146,12 +171,24 @@ class ImageCompareRequest(BaseModel):
     image1_base64: Optional[str] = None
     image2_url: Optional[str] = None
     image2_base64: Optional[str] = None
-    instruction: Optional[str] = Field(
-        default="Describe the similarities and differences between these two images."
+    instruction: Optional[str] = (
+        "Describe the similarities and differences between these two images."
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def check_image_sources(cls, values):
+        """Ensure each image has exactly one source and validate formats."""
+        _validate_image_source(
+            values.get("image1_url"), values.get("image1_base64"), "image1"
+        )
+        _validate_image_source(
+            values.get("image2_url"), values.get("image2_base64"), "image2"
+        )
+        return values
 
-class ImageCompareResponse(BaseModel):
+
+class ImageCompareResponse(ResponseBase):
     request_id: str
     credits_used: int
     comparison_result: str
@@ -160,7 +197,7 @@ class ImageCompareResponse(BaseModel):
 # 2. User Endpoints
 
 
-class CreditsResponse(BaseModel):
+class CreditsResponse(ResponseBase):
     remaining_credits: int
     total_credits_used: int
 
@@ -174,15 +211,65 @@ class FeedbackRequest(BaseModel):
 
     @model_validator(mode="after")
     def validate_request_id(self) -> "FeedbackRequest":
-        try:
-            UUID(self.request_id)
-        except ValueError:
+        if not is_uuid(self.request_id):
             raise ValueError("request_id must be a valid UUID")
         return self
 
 
-class FeedbackResponse(BaseModel):
+class FeedbackResponse(ResponseBase):
     feedback_id: UUID
     request_id: UUID
     message: str
     feedback_timestamp: datetime
+
+
+# 3. Validators
+# Built once at import time so each call dispatches straight to the compiled
+# pydantic-core validator instead of going through the model class.
+
+DESCRIBE_REQUEST_ADAPTER = TypeAdapter(ImageDescribeRequest)
+EXTRACT_REQUEST_ADAPTER = TypeAdapter(ImageExtractRequest)
+CLASSIFY_REQUEST_ADAPTER = TypeAdapter(ImageClassifyRequest)
+ASK_REQUEST_ADAPTER = TypeAdapter(ImageAskRequest)
+COMPARE_REQUEST_ADAPTER = TypeAdapter(ImageCompareRequest)
+FEEDBACK_REQUEST_ADAPTER = TypeAdapter(FeedbackRequest)
+
+DESCRIBE_RESPONSE_ADAPTER = TypeAdapter(ImageDescribeResponse)
+EXTRACT_RESPONSE_ADAPTER = TypeAdapter(ImageExtractResponse)
+CLASSIFY_RESPONSE_ADAPTER = TypeAdapter(ImageClassifyResponse)
+ASK_RESPONSE_ADAPTER = TypeAdapter(ImageAskResponse)
+COMPARE_RESPONSE_ADAPTER = TypeAdapter(ImageCompareResponse)
+CREDITS_RESPONSE_ADAPTER = TypeAdapter(CreditsResponse)
+FEEDBACK_RESPONSE_ADAPTER = TypeAdapter(FeedbackResponse)
+
+RESPONSE_ADAPTERS: Dict[Type[BaseModel], TypeAdapter] = {
+    ImageDescribeResponse: DESCRIBE_RESPONSE_ADAPTER,
+    ImageExtractResponse: EXTRACT_RESPONSE_ADAPTER,
+    ImageClassifyResponse: CLASSIFY_RESPONSE_ADAPTER,
+    ImageAskResponse: ASK_RESPONSE_ADAPTER,
+    ImageCompareResponse: COMPARE_RESPONSE_ADAPTER,
+    CreditsResponse: CREDITS_RESPONSE_ADAPTER,
+    FeedbackResponse: FEEDBACK_RESPONSE_ADAPTER,
+}
+
+
+class UnvalidatedAdapter:
+    """Stand-in for a response TypeAdapter that builds models without validation.
+
+    ``model_construct`` trusts the data as is, so this is only safe for
+    payloads known to match the model.
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+
+    def validate_python(self, data: Dict[str, Any]) -> BaseModel:
+        return self.model.model_construct(**data)
+
+    def validate_json(self, data: bytes) -> BaseModel:
+        return self.validate_python(json_loads(data))
+
+
+UNVALIDATED_RESPONSE_ADAPTERS: Dict[Type[BaseModel], UnvalidatedAdapter] = {
+    model: UnvalidatedAdapter(model) for model in RESPONSE_ADAPTERS
+}
@@ -0,0 +1,69 @@
+# Response caching helpers
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+def make_cache_key(url: Hashable, body: bytes, api_key: str) -> Tuple[Hashable, str]:
+    """Build a cache key from the endpoint URL and a hash of the JSON request body.
+
+    The body hash is keyed with a digest of the API key, so clients of
+    different accounts can share one cache without being served each other's
+    responses. Bodies are serialized from request models, whose field order is
+    fixed, so identical requests always produce identical bytes.
+    """
+    account = hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+    return url, hashlib.blake2b(body, digest_size=16, key=account).hexdigest()
+
+
+class ResponseCache:
+    """Least-recently-used cache for API response bodies.
+
+    Entries optionally expire ``ttl`` seconds after they were stored. The
+    cache is thread-safe, so threads batching requests through one client can
+    share it.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry time or None, value)
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            try:
+                expires_at, value = self._data[key]
+            except KeyError:
+                return None
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
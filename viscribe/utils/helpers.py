@@ -1,56 +1,189 @@
 # Utility functions go here
 
-import base64
-from typing import Any, Dict
-from urllib.parse import urlparse
-from uuid import UUID
+import json
+import os
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Union
 
 import aiohttp
+from pydantic import TypeAdapter
 from requests import Response
 
 from viscribe.exceptions import APIError
 
+try:
+    # SIMD accelerated drop-in replacement, installed with the "speedups" extra
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # Rust JSON library, installed with the "speedups" extra
+    import orjson
+except ImportError:
+    orjson = None
+
+# Read image files in multiples of 3 bytes so the encoded chunks concatenate
+# into the same string as encoding the whole file at once
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+_URL_SCHEMES = frozenset({"http", "https"})
+# The host part of a URL ends at its path, query or fragment
+_NETLOC_END_RE = re.compile(r"[/?#]")
+
+# Canonical UUID, as found in API keys and request ids
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+# Standard base64 alphabet with at most two padding characters
+_B64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+# Response bodies are read from the socket in chunks of this size
+_READ_CHUNK_SIZE = 64 * 1024
+
+# How much of a non-JSON error body (e.g. a proxy's HTML page) to report
+_ERROR_SNIPPET_CHARS = 200
+
+
+def is_uuid(value: str) -> bool:
+    """Whether value is a UUID in its canonical dashed form."""
+    return _UUID_RE.fullmatch(value) is not None
+
 
 def validate_api_key(api_key: str) -> bool:
     if not api_key.startswith("vscrb-"):
         raise ValueError("Invalid API key format. API key must start with 'vscrb-'")
-    uuid_part = api_key[5:]  # Strip out 'vscrb-'
-    try:
-        UUID(uuid_part)
-    except ValueError:
+    if not is_uuid(api_key[6:]):
         raise ValueError(
             "Invalid API key format. API key must be 'vscrb-' followed by a valid UUID. You can get one at https://app.viscribe.ai/"
         )
     return True
 
 
-def handle_sync_response(response: Response) -> Dict[str, Any]:
-    data = response.json()
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to a JSON request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def redact_request_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Return request kwargs fit for logging, with base64 images replaced by their size."""
+    body = kwargs.get("data")
+    if not isinstance(body, (bytes, bytearray)):
+        return kwargs
+    try:
+        payload = json_loads(body)
+    except ValueError:
+        return {**kwargs, "data": f"<{len(body)} bytes>"}
+    if isinstance(payload, dict):
+        payload = {
+            key: (
+                f"<{len(value)} chars>"
+                if key.endswith("base64") and isinstance(value, str)
+                else value
+            )
+            for key, value in payload.items()
+        }
+    return {**kwargs, "data": payload}
+
+
+def error_message(body: bytes, default: str = "Unknown error occurred") -> str:
+    """Extract the error message from an error response body.
+
+    Bodies that are not JSON, such as a gateway's HTML 502 page, are
+    reported by their first characters instead of failing to decode.
+    """
+    try:
+        data = json_loads(body)
+    except ValueError:
+        snippet = bytes(body[:_ERROR_SNIPPET_CHARS]).decode("utf-8", "replace").strip()
+        return snippet or default
+    if isinstance(data, dict):
+        return data.get("error", default)
+    return default
+
+
+async def read_async_response(response: aiohttp.ClientResponse) -> bytearray:
+    """Read a whole aiohttp response body, chunk by chunk."""
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+        body += chunk
+    return body
 
-    if response.status_code >= 400:
-        error_msg = data.get("error", "Unknown error occurred")
-        raise APIError(error_msg, status_code=response.status_code)
 
-    return data
+def parse_response_body(
+    status: int, body: bytes, response_adapter: Optional[TypeAdapter] = None
+) -> Any:
+    """Parse a response body, raising APIError for error statuses.
 
+    Successful bodies are validated straight from the raw JSON bytes when
+    ``response_adapter`` is given, skipping the intermediate dict.
+    """
+    if status >= 400:
+        raise APIError(error_message(body), status_code=status)
 
-async def handle_async_response(response: aiohttp.ClientResponse) -> Dict[str, Any]:
-    data = await response.json()
+    if response_adapter is not None:
+        return response_adapter.validate_json(body)
+    return json_loads(body)
 
-    if response.status >= 400:
-        error_msg = data.get("error", "Unknown error occurred")
-        raise APIError(error_msg, status_code=response.status)
 
-    return data
+def handle_sync_response(
+    response: Response, response_adapter: Optional[TypeAdapter] = None
+) -> Any:
+    """Parse a requests response body."""
+    return parse_response_body(response.status_code, response.content, response_adapter)
+
+
+async def handle_async_response(
+    response: aiohttp.ClientResponse, response_adapter: Optional[TypeAdapter] = None
+) -> Any:
+    """Read an aiohttp response body and parse it."""
+    body = await read_async_response(response)
+    return parse_response_body(response.status, body, response_adapter)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
 
 
 def validate_url_format(url: str) -> bool:
     """Validate URL format."""
     try:
-        result = urlparse(url)
-        if not all([result.scheme, result.netloc]):
+        # Only the scheme and host matter, so split them off directly rather
+        # than fully parsing the URL with urlparse
+        scheme, sep, rest = url.partition("://")
+        netloc = _NETLOC_END_RE.split(rest, 1)[0]
+        if not (sep and scheme and netloc):
             raise ValueError("URL must have a valid scheme and netloc")
-        if result.scheme not in ["http", "https"]:
+        if scheme.lower() not in _URL_SCHEMES:
             raise ValueError("URL scheme must be http or https")
         return True
     except ValueError:
@@ -59,22 +192,66 @@ def validate_url_format(url: str) -> bool:
         raise ValueError(f"Invalid URL format: {str(e)}")
 
 
-def validate_base64_image(b64: str) -> bool:
-    """Validate base64 encoded image format."""
-    try:
-        # Check if it's a data URL
-        if b64.startswith("data:image/"):
-            # Extract the base64 part after the comma
-            b64_part = b64.split(",", 1)[1] if "," in b64 else b64
-        else:
-            b64_part = b64
-
-        # Try to decode
-        decoded = base64.b64decode(b64_part, validate=True)
+def validate_base64_image(b64: str, strict: bool = False) -> bool:
+    """Validate base64 encoded image format.
+
+    By default only the length and alphabet are checked, which needs no
+    decoding; the server decodes the image authoritatively anyway.
+
+    Args:
+        b64: Base64 string, optionally with a ``data:image/...;base64,`` prefix
+        strict: Fully decode the string to validate it
+    """
+    if not isinstance(b64, str):
+        raise ValueError(
+            f"Invalid base64 image format: expected str, got {type(b64).__name__}"
+        )
+    # Check if it's a data URL
+    if b64.startswith("data:image/"):
+        # Extract the base64 part after the comma
+        b64_part = b64.split(",", 1)[1] if "," in b64 else b64
+    else:
+        b64_part = b64
+
+    if strict:
+        try:
+            decoded = base64.b64decode(b64_part, validate=True)
+        except ValueError as e:
+            raise ValueError(f"Invalid base64 image format: {str(e)}")
         if len(decoded) == 0:
             raise ValueError("Base64 string is empty after decoding")
         return True
-    except ValueError:
-        raise
-    except Exception as e:
-        raise ValueError(f"Invalid base64 image format: {str(e)}")
+
+    if not b64_part:
+        raise ValueError("Base64 string is empty after decoding")
+    if len(b64_part) % 4 != 0:
+        raise ValueError("Invalid base64 image format: Incorrect padding")
+    if _B64_RE.fullmatch(b64_part) is None:
+        raise ValueError("Invalid base64 image format: Only base64 data is allowed")
+    return True
+
+
+def encode_image_file(path: Union[str, os.PathLike]) -> str:
+    """Base64 encode an image file without reading it into memory in one piece."""
+    encoded = bytearray()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_B64_CHUNK_SIZE), b""):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
+
+
+def encode_image(
+    image_base64: Optional[str],
+    image_path: Optional[Union[str, os.PathLike]] = None,
+    image_bytes: Optional[bytes] = None,
+) -> Optional[str]:
+    """Return the base64 image payload from whichever single source was given.
+
+    Files and raw bytes are encoded exactly once here; an image_base64 string
+    is passed through untouched.
+    """
+    if image_path is not None:
+        return encode_image_file(image_path)
+    if image_bytes is not None:
+        return base64.b64encode(image_bytes).decode("ascii")
+    return image_base64